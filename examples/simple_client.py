@@ -4,9 +4,9 @@ Simple Pincer SDK Example.
 This script demonstrates how to import and initialize the Pincer SDK client.
 It assumes you have a local Pincer server running (e.g. via `docker compose up`).
 """
-import asyncio
 
 from pincer_sdk import PincerClient
+from pincer_sdk.utils import run_async
 
 
 async def main():
@@ -27,5 +27,5 @@ async def main():
         print("   Make sure the Pincer service is running if you try to make requests.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
 
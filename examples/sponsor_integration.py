@@ -7,16 +7,12 @@ Usage:
     uv run python examples/sponsor_integration.py [session_id]
 """
 
-import asyncio
 import os
 import sys
-from pathlib import Path
 
 from dotenv import load_dotenv
 from pincer_sdk import PincerClient
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from pincer_sdk.utils import run_async
 
 load_dotenv()
 
@@ -67,6 +63,6 @@ if __name__ == "__main__":
         sid = input("Enter Session ID to report: ").strip()
 
     if sid:
-        asyncio.run(report_conversion(sid))
+        run_async(report_conversion(sid))
     else:
         print("❌ No session ID provided.")
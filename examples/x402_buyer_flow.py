@@ -7,21 +7,17 @@ Usage:
     uv run python examples/x402_buyer_flow.py
 """
 
-import asyncio
 import os
-import sys
-from pathlib import Path
 
 import httpx
+import orjson
 from dotenv import load_dotenv
+from pincer_sdk.utils import run_async
 from x402 import x402Client
 from x402.http.clients import x402HttpxClient
 from x402.mechanisms.svm import KeypairSigner
 from x402.mechanisms.svm.exact.register import register_exact_svm_client
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 load_dotenv()
 
 # Default to deployed demo
@@ -53,11 +49,10 @@ async def main():
     try:
         async with x402HttpxClient(client) as http:
             response = await http.get(f"{RESOURCE_URL}/recommendations")
-            await response.aread()
 
             if response.status_code == 200:
                 print("\n✅ SUCCESS: Content received!")
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Show results
                 restaurants = data.get("restaurants", [])
@@ -78,4 +73,4 @@ async def main():
         print(f"\n❌ Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
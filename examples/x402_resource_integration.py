@@ -7,24 +7,22 @@ Usage:
     uv run python examples/x402_resource_integration.py
 """
 
+import logging
 import os
 import sys
-from pathlib import Path
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from pincer_sdk import PincerClient
-from pincer_sdk.facilitator import PincerFacilitatorClient
+from pincer_sdk.facilitator import PincerFacilitatorClient, verification_var
 from pincer_sdk.middleware import PincerPaymentMiddleware
 from x402.http import PaymentOption
 from x402.http.types import RouteConfig
 from x402.mechanisms.svm.exact import ExactSvmServerScheme
 from x402.server import x402ResourceServer
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 load_dotenv()
 
 # Configuration
@@ -32,7 +30,25 @@ PINCER_URL = os.getenv("PINCER_URL", "https://pincer.zeabur.app")
 SVM_ADDRESS = os.getenv("SVM_ADDRESS")
 PORT = 8001
 
-app = FastAPI(title="Example Resource (SVM)")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the shared PincerClient for the lifetime of the worker.
+
+    The client is built in ``create_app`` because the payment middleware needs
+    its facilitator before startup; entering it here ties its connection pool
+    to the serving event loop and closes it cleanly on shutdown. Supported
+    schemes are fetched here, on the pooled client, so the middleware's
+    initialization is served from the facilitator's cache.
+    """
+    async with app.state.pincer_client:
+        await app.state.facilitator.get_supported_async()
+        yield
+
+
+app = FastAPI(title="Example Resource (SVM)", lifespan=lifespan)
 
 def create_app():
     if not SVM_ADDRESS:
@@ -41,20 +57,14 @@ def create_app():
 
     print(f"Connecting to Pincer: {PINCER_URL}")
 
-    # 1. Initialize Pincer Client
+    # 1. Initialize the shared Pincer Client (opened/closed by lifespan)
     pincer_client = PincerClient(base_url=PINCER_URL)
-
-    # Pre-define supported schemes to avoid startup HTTP calls that can deadlock
-    supported_schemes_fallback = {
-        "kinds": [
-            {"x402Version": 2, "scheme": "exact", "network": "solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1", "extra": {}},
-        ],
-        "extensions": [],
-        "signers": []
-    }
+    app.state.pincer_client = pincer_client
 
     # 2. Create x402 server using Pincer's enhanced facilitator
-    facilitator = PincerFacilitatorClient(pincer_client, supported_schemes=supported_schemes_fallback)
+    # (supported schemes are fetched in the lifespan)
+    facilitator = PincerFacilitatorClient(pincer_client)
+    app.state.facilitator = facilitator
     server = x402ResourceServer(facilitator)
     
     # 2. Register Solana Support
@@ -78,31 +88,34 @@ def create_app():
     app.add_middleware(PincerPaymentMiddleware, routes=routes, server=server)
     return app
 
+def _extract_payer(payment) -> str:
+    """Find the payer address in the common locations on the payment state."""
+    if payment is None:
+        return "unknown"
+    context = getattr(payment, "context", None)
+    return (
+        getattr(payment, "user_address", None)
+        or getattr(payment, "payer", None)
+        or (context.get("payer") if isinstance(context, dict) else None)
+        or "unknown"
+    )
+
+
 @app.get("/recommendations")
 async def recommendations(request: Request):
     """Protected endpoint."""
     payment = getattr(request.state, "payment", None)
-    if payment:
-        print(f"DEBUG: Payment Attributes: {dir(payment)}")
-        if hasattr(payment, "context"):
-             print(f"DEBUG: Payment Context: {payment.context}")
-
-    # Try to find payer address in common locations
-    payer = "unknown"
-    if payment:
-        if hasattr(payment, "user_address"):
-            payer = payment.user_address
-        elif hasattr(payment, "payer"):
-            payer = payment.payer
-        elif hasattr(payment, "context") and isinstance(payment.context, dict):
-            payer = payment.context.get("payer", "unknown")
+    # Validated result stored by PincerFacilitatorClient.verify for this request
+    verification = verification_var.get()
+    if payment and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payment context: %s", getattr(payment, "context", None))
 
     return {
         "status": "success",
         "message": "Premium recommendations accessed!",
-        "payer": payer,
+        "payer": _extract_payer(payment),
         "restaurants": [{"name": "Eleven Madison Park", "cuisine": "Fine Dining"}],
-        "sponsors": getattr(payment, "sponsors", []) if payment else []
+        "sponsors": verification.sponsors if verification else [],
     }
 
 if __name__ == "__main__":
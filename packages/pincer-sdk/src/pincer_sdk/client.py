@@ -1,21 +1,47 @@
 """Core Pincer Client."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import hmac
+import logging
+from typing import Any, Dict, List, Optional
 
 import httpx
 
-from .facilitator import PincerFacilitatorClient
-from .merchant_utils import report_conversion_logic
+from .facilitator import PincerFacilitatorClient, _BatchQueue
+from .merchant_utils import build_conversion_payload, report_conversion_logic, send_conversion
+from .types import ConversionEvent, ConversionResponse
+
+logger = logging.getLogger(__name__)
 
 
 class PincerClient:
     """Main entry point for Pincer SDK."""
 
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "webhook_secret",
+        "_hmac_template",
+        "_http",
+        "_verify_batcher",
+        "_conversion_workers",
+        "_conversion_queue",
+        "_workers",
+        "_max_concurrent_reports",
+        "_warmup",
+    )
+
     def __init__(
         self,
         base_url: str,
         api_key: Optional[str] = None,
         webhook_secret: Optional[str] = None,
+        enable_batch_verify: bool = False,
+        conversion_workers: int = 0,
+        conversion_queue_size: int = 1000,
+        max_concurrent_reports: int = 20,
+        warmup: bool = False,
     ):
         """Initialize Pincer Client.
 
@@ -23,19 +49,79 @@ class PincerClient:
             base_url: The URL of the Pincer service.
             api_key: Optional API key for authentication.
             webhook_secret: Optional secret for signing webhooks (required for merchants).
+            enable_batch_verify: Coalesce concurrent /verify calls into
+                /verify_batch requests. Active while the client is used as an
+                async context manager.
+            conversion_workers: Number of background tasks delivering
+                conversion reports. When > 0 and the client is used as an async
+                context manager, ``report_conversion`` queues the report and
+                returns immediately with status "queued".
+            conversion_queue_size: Maximum number of queued conversion reports
+                before ``report_conversion`` waits for a free slot.
+            max_concurrent_reports: Maximum number of in-flight requests used
+                by ``report_conversions_bulk``.
+            warmup: On entering the async context, send a cheap GET /health so
+                the first /verify lands on an already-open TLS/HTTP2 connection
+                instead of paying the handshake in request latency.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.webhook_secret = webhook_secret
-        
-        # Initialize async HTTP client
-        self._http = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+
+        # Pre-keyed HMAC; copying it per message skips re-deriving the padded key
+        self._hmac_template = (
+            hmac.new(webhook_secret.encode(), digestmod=hashlib.sha256) if webhook_secret else None
+        )
+
+        # Initialize async HTTP client. verify/settle/report_conversion all go
+        # through this one pool, so keep connections warm and multiplex over HTTP/2.
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+        )
+        self._verify_batcher = _BatchQueue(self._http) if enable_batch_verify else None
+
+        # Background conversion delivery (fire-and-forget from the caller's view)
+        self._conversion_workers = conversion_workers
+        self._conversion_queue: Optional[asyncio.Queue] = (
+            asyncio.Queue(maxsize=conversion_queue_size) if conversion_workers > 0 else None
+        )
+        self._workers: List[asyncio.Task] = []
+        self._max_concurrent_reports = max_concurrent_reports
+        self._warmup = warmup
 
     async def close(self):
-        """Close the underlying HTTP client."""
+        """Drain queued work and close the underlying HTTP client."""
+        if self._workers:
+            await self._conversion_queue.join()
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+        if self._verify_batcher is not None:
+            await self._verify_batcher.stop()
         await self._http.aclose()
 
     async def __aenter__(self):
+        if self._warmup:
+            try:
+                await self._http.get("/health", timeout=2.0)
+            except httpx.HTTPError:
+                # Best effort: the first real request will connect instead
+                pass
+        if self._verify_batcher is not None:
+            self._verify_batcher.start()
+        if self._conversion_queue is not None and not self._workers:
+            self._workers = [
+                asyncio.create_task(self._conversion_worker())
+                for _ in range(self._conversion_workers)
+            ]
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -54,7 +140,28 @@ class PincerClient:
         merchant_id: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """Report a successful conversion to Pincer."""
+        """Report a successful conversion to Pincer.
+
+        With background workers running, the report is queued and a "queued"
+        response carrying its webhook ID is returned without waiting for Pincer.
+        """
+        if self._workers:
+            payload = build_conversion_payload(
+                self,
+                session_id=session_id,
+                user_address=user_address,
+                purchase_amount=purchase_amount,
+                purchase_asset=purchase_asset,
+                merchant_id=merchant_id,
+                details=details,
+            )
+            await self._conversion_queue.put(payload)
+            return ConversionResponse(
+                status="queued",
+                webhook_id=payload["webhook_id"],
+                message="Conversion queued for delivery",
+            )
+
         return await report_conversion_logic(
             self,
             session_id=session_id,
@@ -64,3 +171,51 @@ class PincerClient:
             merchant_id=merchant_id,
             details=details,
         )
+
+    async def report_conversions_bulk(
+        self, events: List[ConversionEvent]
+    ) -> List[ConversionResponse]:
+        """Report many conversions concurrently (e.g. replaying missed webhooks).
+
+        Requests share the pooled HTTP/2 connection, with at most
+        ``max_concurrent_reports`` in flight. Events carrying a ``timestamp``
+        keep it. Responses are returned in the same order as ``events``.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_reports)
+
+        async def _report(event: ConversionEvent) -> ConversionResponse:
+            payload = build_conversion_payload(
+                self,
+                session_id=event.session_id,
+                user_address=event.user_address,
+                purchase_amount=event.purchase_amount,
+                purchase_asset=event.purchase_asset,
+                merchant_id=event.merchant_id,
+                details=event.details,
+            )
+            if event.timestamp:
+                payload["timestamp"] = event.timestamp
+            async with semaphore:
+                return await send_conversion(self, payload)
+
+        return list(await asyncio.gather(*(_report(event) for event in events)))
+
+    def _sign(self, body: bytes) -> str:
+        """Return the hex HMAC-SHA256 signature of ``body`` with the webhook secret."""
+        if self._hmac_template is None:
+            raise ValueError("Webhook secret is required for signing")
+        h = self._hmac_template.copy()
+        h.update(body)
+        return h.hexdigest()
+
+    async def _conversion_worker(self) -> None:
+        """Deliver queued conversion reports until cancelled."""
+        while True:
+            payload = await self._conversion_queue.get()
+            try:
+                await send_conversion(self, payload)
+            except Exception:
+                # One bad report must not kill the worker: close() joins the queue
+                logger.exception(f"Failed to deliver queued conversion {payload.get('webhook_id')}")
+            finally:
+                self._conversion_queue.task_done()
@@ -1,23 +1,159 @@
 """Facilitator client for Pincer protocol."""
 
+import asyncio
 import logging
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from .types import SponsoredOffer
 
 if TYPE_CHECKING:
+    import httpx
+
     from .client import PincerClient
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Validates a whole sponsors list in one pydantic-core call
+_SPONSORS_ADAPTER = TypeAdapter(List[SponsoredOffer])
+
 # Context variable to store verification result for the current request
 # Exposed here so users/merchant client can access it
 verification_var: ContextVar[Optional[Any]] = ContextVar("verification_result", default=None)
 
 
+@lru_cache(maxsize=32)
+def _dumper_for(cls: type) -> Callable[[Any], Any]:
+    """Return the serializer for instances of ``cls``, resolved once per type."""
+    if hasattr(cls, "model_dump"):
+        return lambda obj: obj.model_dump(by_alias=True, mode="json")
+    if hasattr(cls, "dict"):
+        return lambda obj: obj.dict(by_alias=True)
+    return lambda obj: obj
+
+
+@lru_cache(maxsize=8)
+def _build_supported(frozen_json: bytes) -> Any:
+    """Validate a /supported document once per distinct content."""
+    from x402.schemas import SupportedResponse
+
+    return SupportedResponse(**orjson.loads(frozen_json))
+
+
+def _supported_from(data: Dict[str, Any]) -> Any:
+    """Build the SupportedResponse for a /supported payload.
+
+    Validation is cached per content; each caller gets its own deep copy so
+    facilitators never share a mutable model.
+    """
+    cached = _build_supported(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+    return cached.model_copy(deep=True)
+
+
+class _BatchQueue:
+    """Coalesces concurrent /verify calls into single POST /verify_batch requests.
+
+    Each caller awaits a future; a background task waits up to ``window``
+    seconds (or until ``max_size`` requests are pending), sends the pending
+    requests as one JSON array and resolves the futures from the array response.
+    """
+
+    def __init__(self, http: "httpx.AsyncClient", window: float = 0.005, max_size: int = 32):
+        self._http = http
+        self._window = window
+        self._max_size = max_size
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task on the running loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop collecting, then flush anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._pending:
+            batch = self._take_batch()
+            await self._flush(batch)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one verification request and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        self._wakeup.set()
+        if len(self._pending) >= self._max_size:
+            self._full.set()
+        return await future
+
+    def _take_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        batch = self._pending[: self._max_size]
+        self._pending = self._pending[self._max_size :]
+        if not self._pending:
+            self._wakeup.clear()
+        if len(self._pending) < self._max_size:
+            self._full.clear()
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self._window)
+            except asyncio.TimeoutError:
+                pass
+            task = asyncio.create_task(self._flush(self._take_batch()))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        if not batch:
+            return
+        try:
+            response = await self._http.post(
+                "/verify_batch",
+                content=orjson.dumps([request for request, _ in batch]),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+            results = orjson.loads(response.content)
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"verify_batch returned {len(results)} results for {len(batch)} requests"
+                )
+        except Exception as e:
+            logger.error(f"Pincer batch verification failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 class PincerVerificationResponse(BaseModel):
     """Extended verification response with Pincer-specific fields."""
     is_valid: bool
@@ -34,26 +170,27 @@ class PincerFacilitatorClient:
     Compatible with x402 FacilitatorClient interface but preserves Pincer-specific data.
     """
 
+    __slots__ = ("client", "supported_schemes", "_supported_cache")
+
     def __init__(self, client: "PincerClient", supported_schemes: Optional[Any] = None):
         self.client = client
         self.supported_schemes = supported_schemes
+        self._supported_cache = None
+
+        # Build pre-defined schemes eagerly so get_supported never hits the network
+        if supported_schemes:
+            from x402.schemas import SupportedResponse
+
+            if isinstance(supported_schemes, SupportedResponse):
+                self._supported_cache = supported_schemes
+            else:
+                self._supported_cache = _supported_from(supported_schemes)
 
     async def verify(self, payload, requirements):
         """Verify payment and capture Pincer-specific data (sponsors)."""
         # Serialize payload and requirements for Pincer API
-        if hasattr(payload, "model_dump"):
-            p_dict = payload.model_dump(by_alias=True, mode='json')
-        elif hasattr(payload, "dict"):
-            p_dict = payload.dict(by_alias=True)
-        else:
-            p_dict = payload
-
-        if hasattr(requirements, "model_dump"):
-            r_dict = requirements.model_dump(by_alias=True, mode='json')
-        elif hasattr(requirements, "dict"):
-            r_dict = requirements.dict(by_alias=True)
-        else:
-            r_dict = requirements
+        p_dict = _dumper_for(type(payload))(payload)
+        r_dict = _dumper_for(type(requirements))(requirements)
 
         # Construct request body for Pincer /verify endpoint
         verification_request = {
@@ -61,17 +198,21 @@ class PincerFacilitatorClient:
             "paymentRequirements": r_dict,
         }
         
+        batcher = self.client._verify_batcher
         try:
-            response = await self.client._http.post("/verify", json=verification_request)
-            response.raise_for_status()
-            data = response.json()
+            if batcher is not None and batcher.running:
+                data = await batcher.submit(verification_request)
+            else:
+                response = await self.client._http.post(
+                    "/verify", content=orjson.dumps(verification_request), headers=_JSON_HEADERS
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Pincer verification failed: {e}")
             raise
 
-        sponsors = []
-        if "sponsors" in data:
-            sponsors = [SponsoredOffer(**s) for s in data["sponsors"]]
+        sponsors = _SPONSORS_ADAPTER.validate_python(data.get("sponsors") or [])
 
         # Create extended response object
         result = PincerVerificationResponse(
@@ -90,8 +231,8 @@ class PincerFacilitatorClient:
         from x402.schemas import SettleResponse
         
         # Serialize payload and requirements
-        p_dict = payload.model_dump(by_alias=True, mode='json') if hasattr(payload, "model_dump") else (payload.dict(by_alias=True) if hasattr(payload, "dict") else payload)
-        r_dict = requirements.model_dump(by_alias=True, mode='json') if hasattr(requirements, "model_dump") else (requirements.dict(by_alias=True) if hasattr(requirements, "dict") else requirements)
+        p_dict = _dumper_for(type(payload))(payload)
+        r_dict = _dumper_for(type(requirements))(requirements)
 
         request_body = {
             "paymentPayload": p_dict,
@@ -99,31 +240,55 @@ class PincerFacilitatorClient:
         }
         
         # Use the SDK's authenticated HTTP client
-        response = await self.client._http.post("/settle", json=request_body)
+        response = await self.client._http.post(
+            "/settle", content=orjson.dumps(request_body), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         return SettleResponse(**data)
     
+    async def get_supported_async(self):
+        """Get supported payment kinds/schemes using the pooled HTTP client.
+
+        Prefer this from async code (e.g. an app startup hook): it reuses the
+        connection that verify/settle will use and fills the cache read by
+        ``get_supported``.
+        """
+        if self._supported_cache is not None:
+            return self._supported_cache
+
+        response = await self.client._http.get("/supported")
+        response.raise_for_status()
+        self._supported_cache = _supported_from(orjson.loads(response.content))
+        return self._supported_cache
+
     def get_supported(self):
-        """Get supported payment kinds/schemes."""
+        """Get supported payment kinds/schemes.
+
+        The result is cached, so the facilitator is queried at most once.
+        x402 calls this synchronously when the payment middleware initializes
+        (inside the running event loop), so a cache miss here falls back to a
+        one-off blocking request: the pooled async client is bound to its loop
+        and cannot be driven from sync code. Call ``get_supported_async`` from
+        the app lifespan to avoid that.
+        """
         from x402.schemas import SupportedResponse
-        
-        # 1. Use pre-defined schemes if available (avoids startup HTTP calls)
-        if self.supported_schemes:
-            if isinstance(self.supported_schemes, SupportedResponse):
-                return self.supported_schemes
-            return SupportedResponse(**self.supported_schemes)
-            
-        # 2. Otherwise fetch from the facilitator API
+
+        # 1. Use pre-defined or previously fetched schemes (avoids HTTP calls)
+        if self._supported_cache is not None:
+            return self._supported_cache
+
+        # 2. Otherwise fetch from the facilitator API once
         import httpx
-        base_url = str(self.client._http.base_url) if hasattr(self.client, "_http") else str(self.client.base_url)
-        
+        base_url = str(self.client._http.base_url)
+
         try:
             with httpx.Client(base_url=base_url, timeout=5.0) as client:
                 response = client.get("/supported")
                 response.raise_for_status()
-                return SupportedResponse(**response.json())
+                self._supported_cache = _supported_from(orjson.loads(response.content))
+                return self._supported_cache
         except Exception as e:
             logger.warning(f"Could not fetch supported schemes from {base_url}: {e}")
             # Return a minimal valid response as fallback to allow startup to continue
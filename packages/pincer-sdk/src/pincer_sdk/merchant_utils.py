@@ -1,13 +1,13 @@
 """Internal merchant utilities for Pincer SDK."""
 
-import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import orjson
+
 from .types import ConversionResponse
-from .utils import create_webhook_signature
 
 if TYPE_CHECKING:
     from .client import PincerClient
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-async def report_conversion_logic(
+def build_conversion_payload(
     client: "PincerClient",
     session_id: str,
     user_address: str,
@@ -23,8 +23,8 @@ async def report_conversion_logic(
     purchase_asset: str = "USD",
     merchant_id: Optional[str] = None,
     details: Optional[Dict[str, Any]] = None,
-) -> ConversionResponse:
-    """Report a successful conversion to Pincer."""
+) -> Dict[str, Any]:
+    """Build the conversion webhook payload, assigning a new webhook ID."""
     if not client.webhook_secret:
         raise ValueError("webhook_secret is required to report conversions")
 
@@ -44,18 +44,24 @@ async def report_conversion_logic(
     if details:
         payload.update(details)
 
-    # Create JSON string for signing
-    payload_str = json.dumps(payload)
-    
-    # Generate signature
-    signature = create_webhook_signature(payload_str, client.webhook_secret)
+    return payload
 
-    logger.info(f"Reporting conversion {webhook_id} to Pincer for session {session_id}")
+
+async def send_conversion(client: "PincerClient", payload: Dict[str, Any]) -> ConversionResponse:
+    """Sign and deliver a conversion payload to Pincer."""
+    webhook_id = payload["webhook_id"]
+
+    logger.info(f"Reporting conversion {webhook_id} to Pincer for session {payload['session_id']}")
 
     try:
+        # Serialize once; the same bytes are signed and sent. OPT_NON_STR_KEYS
+        # keeps accepting the int/other keys json.dumps allowed in ``details``.
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        signature = client._sign(body)
+
         response = await client._http.post(
             "/webhooks/conversion",
-            content=payload_str,
+            content=body,
             headers={
                 "X-Webhook-Signature": signature,
                 "Content-Type": "application/json",
@@ -63,7 +69,7 @@ async def report_conversion_logic(
         )
         
         if response.status_code in [200, 201]:
-            data = response.json()
+            data = orjson.loads(response.content)
             return ConversionResponse(
                 status="success",
                 webhook_id=webhook_id,
@@ -85,3 +91,25 @@ async def report_conversion_logic(
             webhook_id=webhook_id,
             error=str(e),
         )
+
+
+async def report_conversion_logic(
+    client: "PincerClient",
+    session_id: str,
+    user_address: str,
+    purchase_amount: float,
+    purchase_asset: str = "USD",
+    merchant_id: Optional[str] = None,
+    details: Optional[Dict[str, Any]] = None,
+) -> ConversionResponse:
+    """Report a successful conversion to Pincer."""
+    payload = build_conversion_payload(
+        client,
+        session_id=session_id,
+        user_address=user_address,
+        purchase_amount=purchase_amount,
+        purchase_asset=purchase_asset,
+        merchant_id=merchant_id,
+        details=details,
+    )
+    return await send_conversion(client, payload)
@@ -115,7 +115,10 @@ class PincerPaymentMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         # Initialize our Custom HTTP Server
         self.http_server = PincerHTTPResourceServer(server, routes)
-        self.http_server.initialize()
+        # Starlette builds the middleware stack before the lifespan runs, so
+        # initialization (which reads the facilitator's /supported) waits for
+        # the first paid request, giving startup hooks a chance to warm it.
+        self._initialized = False
 
     async def dispatch(self, request: Request, call_next):
         # Create adapter and context
@@ -133,6 +136,10 @@ class PincerPaymentMiddleware(BaseHTTPMiddleware):
         if not self.http_server.requires_payment(context):
             return await call_next(request)
 
+        if not self._initialized:
+            self.http_server.initialize()
+            self._initialized = True
+
         # Process payment request
         result = await self.http_server.process_http_request(context)
 
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Coupon(BaseModel):
@@ -12,6 +12,8 @@ class Coupon(BaseModel):
     discount_type: str  # "percentage" or "fixed"
     description: str
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class SponsoredOffer(BaseModel):
     """Sponsored offer details returned by Pincer."""
@@ -26,6 +28,8 @@ class SponsoredOffer(BaseModel):
     session_id: str
     offer_id: str
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class ConversionEvent(BaseModel):
     """Conversion event data to be sent to Pincer."""
@@ -37,6 +41,8 @@ class ConversionEvent(BaseModel):
     timestamp: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class ConversionResponse(BaseModel):
     """Response from reporting a conversion."""
@@ -44,3 +50,5 @@ class ConversionResponse(BaseModel):
     webhook_id: Optional[str] = None
     message: Optional[str] = None
     error: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
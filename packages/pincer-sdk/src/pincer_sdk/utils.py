@@ -1,7 +1,11 @@
 """Utility functions for Pincer SDK."""
 
+import asyncio
 import hashlib
 import hmac
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
 
 
 def create_webhook_signature(payload: str, secret: str) -> str:
@@ -22,3 +26,22 @@ def create_webhook_signature(payload: str, secret: str) -> str:
         payload.encode(),
         hashlib.sha256,
     ).hexdigest()
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Drop-in replacement for ``asyncio.run`` in scripts; install the
+    ``pincer-sdk[uvloop]`` extra to get the libuv-based event loop.
+
+    Args:
+        main: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
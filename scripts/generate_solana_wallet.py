@@ -4,7 +4,6 @@
 這個腳本會生成一個新的 Solana 錢包並顯示所有需要的資訊
 """
 
-import base58  # type: ignore
 from solders.keypair import Keypair
 
 print("🔑 正在生成 Solana 測試錢包...")
@@ -16,9 +15,8 @@ keypair = Keypair()
 # 獲取公鑰（地址）
 address = str(keypair.pubkey())
 
-# 獲取私鑰（Base58 格式）
-private_key_bytes = bytes(keypair)
-private_key_base58 = base58.b58encode(private_key_bytes).decode('ascii')
+# 獲取私鑰（Base58 格式，由 solders 原生編碼）
+private_key_base58 = str(keypair)
 
 print("\n✅ 錢包已生成！\n")
 
@@ -42,5 +40,5 @@ print("   訪問: https://faucet.solana.com/")
 print(f"   輸入你的地址: {address}")
 print("   點擊 'Request Airdrop' 獲取 1-2 SOL\n")
 
-print("✅ 完成後運行: uv run python scripts/init_ledger.py")
+print("✅ 完成後運行: uv run python -m scripts.init_ledger")
 print("=" * 60)
@@ -8,12 +8,13 @@ echo "🔄 Resetting Pincer demo state..."
 # Remove existing database
 if [ -f "pincer.db" ]; then
     echo "  📁 Removing existing database..."
-    rm pincer.db
+    # WAL mode keeps -wal/-shm side files next to the database
+    rm -f pincer.db pincer.db-wal pincer.db-shm
 fi
 
 # Reinitialize database
 echo "  🗄️  Reinitializing database..."
-python scripts/init_ledger.py
+python -m scripts.init_ledger
 
 echo "✅ Demo state reset complete!"
 echo ""
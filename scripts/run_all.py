@@ -3,6 +3,10 @@ import os
 import subprocess
 import time
 
+import httpx
+
+PINCER_URL = os.getenv("PINCER_URL", "http://localhost:4022")
+
 
 def run_service(name, cmd, env=None):
     print(f"🚀 Starting {name}...")
@@ -11,20 +15,41 @@ def run_service(name, cmd, env=None):
         my_env.update(env)
     return subprocess.Popen(cmd, env=my_env)
 
+def wait_for_health(url, deadline=10.0):
+    """Poll ``url``/health with exponential backoff until it answers 200.
+
+    Returns True once healthy, or False if ``deadline`` seconds pass first.
+    """
+    start = time.monotonic()
+    attempt = 0
+    with httpx.Client(timeout=1.0) as client:
+        while True:
+            try:
+                if client.get(f"{url}/health").status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            remaining = deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05 * 2**attempt, 1.0, remaining))
+            attempt += 1
+
 def main():
     services = []
     try:
         # 1. Start Pincer Faciltator
-        services.append(run_service("Pincer Facilitator", ["uv", "run", "python", "src/pincer/server.py"]))
+        services.append(run_service("Pincer Facilitator", ["uv", "run", "python", "-m", "src.pincer.server"]))
         
         # 2. Wait for Facilitator to start
-        time.sleep(2)
+        if not wait_for_health(PINCER_URL):
+            print(f"⚠️  Pincer not healthy at {PINCER_URL} yet, starting the rest anyway")
         
         # 3. Start Resource Server
-        services.append(run_service("Resource Server", ["uv", "run", "python", "src/resource/server.py"]))
+        services.append(run_service("Resource Server", ["uv", "run", "python", "-m", "src.resource.server"]))
         
         # 4. Start Merchant Server
-        services.append(run_service("Merchant Server", ["uv", "run", "python", "src/merchant/server.py"]))
+        services.append(run_service("Merchant Server", ["uv", "run", "python", "-m", "src.merchant.server"]))
         
         print("\n✅ All services started. Press Ctrl+C to stop all.\n")
         
@@ -43,7 +43,7 @@ fi
 # Initialize database
 echo ""
 echo "🗄️  Initializing database..."
-uv run python scripts/init_ledger.py
+uv run python -m scripts.init_ledger
 
 echo ""
 echo "✅ Setup complete!"
@@ -18,19 +18,19 @@ read -p "輸入選項 (1-4): " choice
 case $choice in
   1)
     echo "🍽️  啟動 Resource Server..."
-    uv run python src/resource/server.py
+    uv run python -m src.resource.server
     ;;
   2)
     echo "⚡ 啟動 Pincer..."
-    uv run python src/pincer/server.py
+    uv run python -m src.pincer.server
     ;;
   3)
     echo "🍔 啟動 Shake Shack..."
-    uv run python src/merchant/server.py
+    uv run python -m src.merchant.server
     ;;
   4)
     echo "🤖 運行 Agent Demo..."
-    uv run python src/agent/demo.py
+    uv run python -m src.agent.demo
     ;;
   *)
     echo "❌ 無效選項"
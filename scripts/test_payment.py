@@ -1,10 +1,9 @@
-"""Quick debug script to test x402 payment flow."""
-import asyncio
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+"""Quick debug script to test x402 payment flow.
 
+Usage (from the repository root):
+    uv run python -m scripts.test_payment
+"""
+from pincer_sdk.utils import run_async
 from x402 import x402Client
 from x402.http.clients import x402HttpxClient
 from x402.mechanisms.svm import KeypairSigner
@@ -52,4 +51,4 @@ async def test_payment():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_payment())
+    run_async(test_payment())
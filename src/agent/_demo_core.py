@@ -0,0 +1,89 @@
+"""Shared building blocks for the demo agents (demo.py and minimal.py).
+
+Both agents pay for the same endpoint; this module owns the pieces they have
+in common: signer parsing, x402 client setup and the HTTP connection pool.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import httpx
+from x402 import x402Client
+from x402.http import x402HTTPClient
+from x402.http.clients import x402_httpx_transport
+
+from src.config import get_runtime_config
+
+# The SVM and EVM signer stacks are imported only on the branch that uses
+# them: the EVM side (eth_account, web3 helpers) alone takes ~1 s to import.
+if TYPE_CHECKING:
+    from x402.mechanisms.svm import KeypairSigner
+
+config = get_runtime_config()
+
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+@lru_cache(maxsize=1)
+def get_svm_signer() -> "KeypairSigner":
+    """Parse the configured Solana key once per process."""
+    from x402.mechanisms.svm import KeypairSigner
+
+    return KeypairSigner.from_base58(config.svm_private_key)
+
+
+@lru_cache(maxsize=1)
+def get_evm_account():
+    """Parse the configured EVM key once per process."""
+    from eth_account import Account
+
+    return Account.from_key(config.evm_private_key)
+
+
+@lru_cache(maxsize=2)
+def build_x402_client(svm_only: bool = False):
+    """Create the x402 client and register the configured signer.
+
+    Returns ``(client, http_client, address, network_name)``, or
+    None when no usable private key is configured. This is CPU-only key
+    parsing, so callers can run it in a thread while other I/O is in flight.
+    The configured client holds no per-payment state, so it is built once per
+    process and reused by later runs.
+    """
+    # Create x402 client
+    client = x402Client()
+    http_client = x402HTTPClient(client)
+
+    # Register payment schemes (優先使用 Solana)
+    if config.svm_private_key:
+        from x402.mechanisms.svm.exact.register import register_exact_svm_client
+
+        svm_signer = get_svm_signer()
+        register_exact_svm_client(client, svm_signer)
+        return client, http_client, svm_signer.address, "Solana Devnet"
+    if config.evm_private_key and not svm_only:
+        from x402.mechanisms.evm import EthAccountSigner
+        from x402.mechanisms.evm.exact.register import register_exact_evm_client
+
+        account = get_evm_account()
+        register_exact_evm_client(client, EthAccountSigner(account))
+        return client, http_client, account.address, "Base Sepolia"
+    return None
+
+
+def new_transport() -> httpx.AsyncHTTPTransport:
+    """Create the connection pool shared by every request of one run."""
+    return httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS)
+
+
+def paid_client(client: x402Client, transport: httpx.AsyncHTTPTransport) -> httpx.AsyncClient:
+    """Return an AsyncClient that answers 402 challenges over ``transport``."""
+    return httpx.AsyncClient(
+        transport=x402_httpx_transport(client, transport=transport),
+        timeout=HTTP_TIMEOUT,
+    )
@@ -9,45 +9,129 @@ Based on Coinbase x402 httpx client example.
 """
 
 import asyncio
+import sys
+from typing import Any, Optional
 
 import httpx
-from eth_account import Account
-from x402 import x402Client
-from x402.http import x402HTTPClient
-from x402.http.clients import x402HttpxClient
-from x402.mechanisms.evm import EthAccountSigner
-from x402.mechanisms.evm.exact.register import register_exact_evm_client
-from x402.mechanisms.svm import KeypairSigner
-from x402.mechanisms.svm.exact.register import register_exact_svm_client
-
-from src.config import config, validate_config_for_service
+from pincer_sdk.utils import run_async
+from pydantic import BaseModel
+
+from src.agent._demo_core import HTTP_TIMEOUT, build_x402_client, new_transport, paid_client
+from src.config import get_runtime_config, validate_config_for_service
 from src.logging_utils import (
     CorrelationIdContext,
     generate_correlation_id,
     get_logger,
     setup_logging,
 )
+from src.models import Restaurant
 
 # Validate configuration
 validate_config_for_service("agent")
+config = get_runtime_config()
 
 # Setup logging
 setup_logging(config.log_level, "text")  # Use text format for better readability in demo
 logger = get_logger(__name__)
 
+_SEP70 = "=" * 70
+_DASH70 = "─" * 70
+# Block explorer (account, transaction) URL templates per network
+_EXPLORERS = {
+    "Solana Devnet": (
+        "https://solscan.io/account/{}?cluster=devnet",
+        "https://solscan.io/tx/{}?cluster=devnet",
+    ),
+    "Base Sepolia": (
+        "https://sepolia.basescan.org/address/{}",
+        "https://sepolia.basescan.org/tx/{}",
+    ),
+}
+_PRICE_LEVELS = tuple("$" * n for n in range(5))  # price_level is 1-4
+
+
+class _Recommendations(BaseModel):
+    """Agent-side view of the /recommendations body.
+
+    Restaurants are typed; sponsors stay plain dicts because their coupon
+    fields differ between the Pincer server and SDK wire formats.
+    """
+
+    restaurants: list[Restaurant] = []
+    session_id: Optional[str] = None
+    sponsors: list[dict[str, Any]] = []
+
+
+def _emit(lines: list[str]) -> None:
+    """Write a block of output lines with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _header_lines(title: str) -> list[str]:
+    return ["\n" + _SEP70, f"  {title}", _SEP70 + "\n"]
+
+
+def _step_lines(step: int, title: str) -> list[str]:
+    return ["\n" + _DASH70, f"  Step {step}: {title}", _DASH70 + "\n"]
+
 
 def print_header(title: str):
     """Print a section header for demo output."""
-    print(f"\n{'=' * 70}")
-    print(f"  {title}")
-    print(f"{'=' * 70}\n")
+    _emit(_header_lines(title))
 
 
 def print_step(step: int, title: str):
     """Print a step indicator."""
-    print(f"\n{'─' * 70}")
-    print(f"  Step {step}: {title}")
-    print(f"{'─' * 70}\n")
+    _emit(_step_lines(step, title))
+
+
+def _restaurant_lines(restaurants: list[Restaurant]) -> list[str]:
+    """Render the recommendation list."""
+    lines = []
+    for i, restaurant in enumerate(restaurants, 1):
+        level = restaurant.price_level
+        price = _PRICE_LEVELS[level] if 0 <= level < len(_PRICE_LEVELS) else "$" * level
+        lines.append(f"   {i}. {restaurant.name}")
+        lines.append(f"      {restaurant.cuisine} | {price} | {restaurant.rating}★")
+        if restaurant.description:
+            lines.append(f"      \"{restaurant.description[:50]}...\"")
+        lines.append("")
+    return lines
+
+
+def _sponsor_lines(sponsors: list[dict]) -> list[str]:
+    """Render sponsor offers, or a note that there are none."""
+    if not sponsors:
+        return ["\n🎁 Sponsor Offers: None available for this session.\n"]
+
+    lines = ["\n🎁 Sponsor Offers:\n"]
+    for sponsor in sponsors:
+        lines.append(f"   💰 {sponsor['merchant_name']}")
+        lines.append(f"      {sponsor['offer_text']}")
+        # Handle rebate amount which might be string (old) or float (new)
+        rebate_val = sponsor.get('rebate_amount')
+        rebate_asset = sponsor.get('rebate_asset', 'USDC')
+        if isinstance(rebate_val, float):
+            lines.append(f"      Rebate: {rebate_val:.6f} {rebate_asset} (x402 fee refund)")
+        else:
+            lines.append(f"      Rebate: {rebate_val} (x402 fee refund)")
+
+        # Display coupons
+        coupons = sponsor.get('coupons', [])
+        if coupons:
+            lines.append("      Coupons:")
+            for coupon in coupons:
+                discount = f"{coupon['discount_value']}%" if coupon['discount_type'] == 'percentage' else f"${coupon['discount_value']}"
+                lines.append(f"         • {coupon['code']}: {coupon['description']} ({discount})")
+
+        # Display checkout URL
+        if 'checkout_url' in sponsor:
+            lines.append(f"      Checkout: {sponsor['checkout_url']}")
+        elif 'merchant_url' in sponsor:
+            lines.append(f"      Checkout: {sponsor['merchant_url']}")
+        lines.append("")
+    return lines
 
 
 async def main():
@@ -60,18 +144,27 @@ async def main():
         print_header("🚀 Pincer x402 Demo")
         print("This demo shows how x402 enables payment-gated API access.")
         print(f"Correlation ID: {correlation_id}")
-        logger.info(f"Starting demo with correlation ID: {correlation_id}")
+        # CorrelationIdContext tags every record; no need to repeat the ID
+        logger.info("Starting demo")
 
-        # ====================================================================
-        # Step 1: Initial Request (No Payment)
-        # ====================================================================
-        print_step(1, "Request paywalled content (no payment)")
+        # One connection pool for the whole run
+        transport = new_transport()
+        async with httpx.AsyncClient(transport=transport, timeout=HTTP_TIMEOUT) as session:
+
+            # ====================================================================
+            # Step 1: Initial Request (No Payment)
+            # ====================================================================
+            print_step(1, "Request paywalled content (no payment)")
 
-        print("Making GET request to /recommendations without payment...")
+            print("Making HEAD request to /recommendations without payment...")
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
+            # Signer setup does no I/O; overlap it with the probe round trip
+            payment_setup = asyncio.create_task(asyncio.to_thread(build_x402_client))
+
+            try:
+                # Only the status matters; HEAD skips the 402 body and, unlike an
+                # unread streamed GET, leaves the HTTP/1.1 connection reusable.
+                response = await session.head(
                     f"{config.resource_url}/recommendations",
                     headers={"X-Correlation-Id": correlation_id},
                 )
@@ -83,161 +176,103 @@ async def main():
                     print(f"\n❌ Unexpected status: {response.status_code}")
                     return
 
-        except Exception as e:
-            logger.error(f"Error making initial request: {e}")
-            return
+            except Exception as e:
+                logger.error("Error making initial request: %s", e)
+                return
+
+            # ====================================================================
+            # Step 2: Setup Payment
+            # ====================================================================
+            print_step(2, "Prepare payment credentials")
 
-        # ====================================================================
-        # Step 2: Setup Payment
-        # ====================================================================
-        print_step(2, "Prepare payment credentials")
-
-        # Format payment amount properly
-        # Format payment amount properly
-        price_usd = config.content_price_usd
-        print(f"Payment amount: {price_usd:.6f} USDC")
-
-        # Create x402 client
-        client = x402Client()
-        http_client = x402HTTPClient(client)
-
-        # Register payment schemes (優先使用 Solana)
-        _ = None
-        network_name = None
-        is_solana = False
-
-        if config.svm_private_key:
-            svm_signer = KeypairSigner.from_base58(config.svm_private_key)
-            register_exact_svm_client(client, svm_signer)
-            _ = svm_signer.address
-            network_name = "Solana Devnet"
-            is_solana = True
-            print(f"\n🔐 Wallet: {svm_signer.address}")
-            print(f"   → https://solscan.io/account/{svm_signer.address}?cluster=devnet")
-            print(f"🌐 Network: {network_name}")
-        elif config.evm_private_key:
-            account = Account.from_key(config.evm_private_key)
-            register_exact_evm_client(client, EthAccountSigner(account))
-            _ = account.address
-            network_name = "Base Sepolia"
-            is_solana = False
-            print(f"\n🔐 Wallet: {account.address}")
-            print(f"   → https://sepolia.basescan.org/address/{account.address}")
+            # Format payment amount properly
+            price_usd = config.content_price_usd
+            print(f"Payment amount: {price_usd:.6f} USDC")
+
+            setup = await payment_setup
+            if setup is None:
+                print("\n❌ No private key configured!")
+                print("   Set SVM_PRIVATE_KEY or EVM_PRIVATE_KEY in .env")
+                return
+
+            client, http_client, address, network_name = setup
+            account_url, tx_url = _EXPLORERS[network_name]
+            print(f"\n🔐 Wallet: {address}")
+            print(f"   → {account_url.format(address)}")
             print(f"🌐 Network: {network_name}")
-        else:
-            print("\n❌ No private key configured!")
-            print("   Set SVM_PRIVATE_KEY or EVM_PRIVATE_KEY in .env")
-            return
 
-        # ====================================================================
-        # Step 3: Request with Payment
-        # ====================================================================
-        print_step(3, "Request with payment proof")
-
-        print("Signing payment and retrying request...")
-        print("(x402 client handles this automatically)")
-
-        async with x402HttpxClient(client) as http:
-            response = await http.get(
-                f"{config.resource_url}/recommendations",
-                headers={"X-Correlation-Id": correlation_id},
-            )
-            await response.aread()
-
-            if response.is_success:
-                print(f"\n✅ Success! HTTP {response.status_code}")
-
-                # Parse response
-                data = response.json()
-                restaurants = data.get("restaurants", [])
-                session_id = data.get("session_id")
-
-                # ====================================================================
-                # Step 4: Display Results
-                # ====================================================================
-                print_step(4, "Content received")
-
-                print(f"📋 {len(restaurants)} restaurant recommendations:\n")
-                for i, restaurant in enumerate(restaurants[:5], 1):
-                    _ = "⭐" * int(restaurant.get('rating', 0))
-                    price = "$" * restaurant['price_level']
-                    print(f"   {i}. {restaurant['name']}")
-                    print(f"      {restaurant['cuisine']} | {price} | {restaurant.get('rating', 'N/A')}★")
-                    if restaurant.get('description'):
-                        print(f"      \"{restaurant['description'][:50]}...\"")
-                    print()
-
-                # Print sponsors if available
-                sponsors = data.get("sponsors", [])
-                if sponsors:
-                    print("\n🎁 Sponsor Offers:\n")
-                    for sponsor in sponsors:
-                        print(f"   💰 {sponsor['merchant_name']}")
-                        print(f"      {sponsor['offer_text']}")
-                        # Handle rebate amount which might be string (old) or float (new)
-                        rebate_val = sponsor.get('rebate_amount')
-                        rebate_asset = sponsor.get('rebate_asset', 'USDC')
-                        if isinstance(rebate_val, float):
-                            print(f"      Rebate: {rebate_val:.6f} {rebate_asset} (x402 fee refund)")
-                        else:
-                            print(f"      Rebate: {rebate_val} (x402 fee refund)")
-                        
-                        # Display coupons
-                        coupons = sponsor.get('coupons', [])
-                        if coupons:
-                            print("      Coupons:")
-                            for coupon in coupons:
-                                discount = f"{coupon['discount_value']}%" if coupon['discount_type'] == 'percentage' else f"${coupon['discount_value']}"
-                                print(f"         • {coupon['code']}: {coupon['description']} ({discount})")
-                        
-                        # Display checkout URL
-                        if 'checkout_url' in sponsor:
-                            print(f"      Checkout: {sponsor['checkout_url']}")
-                        elif 'merchant_url' in sponsor:
-                            print(f"      Checkout: {sponsor['merchant_url']}")
-                        print()
+            # ====================================================================
+            # Step 3: Request with Payment
+            # ====================================================================
+            print_step(3, "Request with payment proof")
+
+            print("Signing payment and retrying request...")
+            print("(x402 client handles this automatically)")
+
+            # The paid client wraps the same transport, so the retry reuses the
+            # connection opened by the probe instead of handshaking again.
+            async with paid_client(client, transport) as http:
+                response = await http.get(
+                    f"{config.resource_url}/recommendations",
+                    headers={"X-Correlation-Id": correlation_id},
+                )
+
+                logger.debug("Paid request negotiated %s", response.http_version)
+
+                if response.is_success:
+                    print(f"\n✅ Success! HTTP {response.status_code}")
+
+                    # Parse and validate the body in one pass (pydantic-core)
+                    data = _Recommendations.model_validate_json(response.content)
+                    restaurants = data.restaurants
+                    session_id = data.session_id
+
+                    # ====================================================================
+                    # Step 4: Display Results
+                    # ====================================================================
+                    lines = _step_lines(4, "Content received")
+                    lines.append(f"📋 {len(restaurants)} restaurant recommendations:\n")
+                    lines += _restaurant_lines(restaurants[:5])
+                    lines += _sponsor_lines(data.sponsors)
+
+                    # Extract payment response
+                    try:
+                        settle_response = http_client.get_payment_settle_response(
+                            response.headers.get
+                        )
+                        lines.append("\n💳 Payment Settlement:")
+                        lines.append(f"   Status: {'✅ Success' if settle_response.success else '❌ Failed'}")
+                        lines.append(f"   Payer: {settle_response.payer}")
+                        if settle_response.transaction:
+                            tx = settle_response.transaction
+                            lines.append(f"   TX: {tx}")
+                            # Add explorer link
+                            lines.append(f"   → {tx_url.format(tx)}")
+                    except ValueError:
+                        lines.append("\n💳 Payment completed")
+
+                    _emit(lines)
+
                 else:
-                    print("\n🎁 Sponsor Offers: None available for this session.\n")
-
-                # Extract payment response
-                try:
-                    settle_response = http_client.get_payment_settle_response(
-                        lambda name: response.headers.get(name)
-                    )
-                    print("\n💳 Payment Settlement:")
-                    print(f"   Status: {'✅ Success' if settle_response.success else '❌ Failed'}")
-                    print(f"   Payer: {settle_response.payer}")
-                    if settle_response.transaction:
-                        tx = settle_response.transaction
-                        print(f"   TX: {tx}")
-                        # Add explorer link
-                        if is_solana:
-                            print(f"   → https://solscan.io/tx/{tx}?cluster=devnet")
-                        else:
-                            print(f"   → https://sepolia.basescan.org/tx/{tx}")
-                except ValueError:
-                    print("\n💳 Payment completed")
-
-            else:
-                print(f"\n❌ Request failed: HTTP {response.status_code}")
-                print(response.text)
-                return
+                    print(f"\n❌ Request failed: HTTP {response.status_code}")
+                    print(response.text)
+                    return
 
         # ====================================================================
         # Summary
         # ====================================================================
-        print_header("✨ Demo Complete")
-        
-        print("What happened:")
-        print("  1. Initial request returned HTTP 402 (Payment Required)")
-        print("  2. x402 client signed a payment transaction")
-        print("  3. Pincer (facilitator) verified the payment on-chain")
-        print("  4. Content + sponsor offers returned to user")
-        print()
-        print(f"Session ID: {session_id}")
-        print(f"Correlation ID: {correlation_id}")
-        print()
+        _emit(_header_lines("✨ Demo Complete") + [
+            "What happened:",
+            "  1. Initial request returned HTTP 402 (Payment Required)",
+            "  2. x402 client signed a payment transaction",
+            "  3. Pincer (facilitator) verified the payment on-chain",
+            "  4. Content + sponsor offers returned to user",
+            "",
+            f"Session ID: {session_id}",
+            f"Correlation ID: {correlation_id}",
+            "",
+        ])
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
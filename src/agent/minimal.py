@@ -1,41 +1,37 @@
+"""Minimal x402 agent: pay for /recommendations and print the result.
 
-import asyncio
-import sys
-from pathlib import Path
+Usage (from the repository root):
+    uv run python -m src.agent.minimal
+"""
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import orjson
+from pincer_sdk.utils import run_async
 
-from x402 import x402Client
-from x402.http.clients import x402HttpxClient
-from x402.mechanisms.svm import KeypairSigner
-from x402.mechanisms.svm.exact.register import register_exact_svm_client
+from src.agent._demo_core import build_x402_client, new_transport, paid_client
+from src.config import get_runtime_config
 
-from src.config import config
+config = get_runtime_config()
 
 
 async def main():
     print("🚀 Starting Minimal x402 Agent...")
 
     # 1. Initialize Client & Wallet
-    client = x402Client()
-    
-    if config.svm_private_key:
-        signer = KeypairSigner.from_base58(config.svm_private_key)
-        register_exact_svm_client(client, signer)
-        print(f"🔐 Wallet: {signer.address} (Solana)")
-    else:
+    setup = build_x402_client(svm_only=True)
+    if setup is None:
         print("❌ Error: SVM_PRIVATE_KEY not found in .env")
         return
+    client, _, address, _ = setup
+    print(f"🔐 Wallet: {address} (Solana)")
 
     # 2. Make Request (Auto-handles 402 Payment)
     print("📡 Requesting content...")
     
-    async with x402HttpxClient(client) as http:
+    async with paid_client(client, new_transport()) as http:
         response = await http.get(f"{config.resource_url}/recommendations")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"Received data: {data}")
             restaurants = data.get("restaurants", [])
             sponsors = data.get("sponsors", [])
@@ -52,4 +48,4 @@ async def main():
             print(f"❌ Failed: {response.status_code} - {response.text}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -3,14 +3,20 @@
 Loads all configuration from environment variables with sensible defaults.
 """
 
+import os
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file. Child processes inherit the
+# loaded values, so they skip re-reading the file.
+if not os.environ.get("_PINCER_ENV_LOADED"):
+    load_dotenv()
+    os.environ["_PINCER_ENV_LOADED"] = "1"
 
 
 class Config(BaseSettings):
@@ -51,6 +57,14 @@ class Config(BaseSettings):
     merchant_host: str = Field(default="0.0.0.0")
     merchant_port: int = Field(default=4023)
     merchant_url: str = Field(default="http://localhost:4023", description="URL of the Merchant server")
+    merchant_webhook_workers: int = Field(
+        default=4,
+        description="Background tasks delivering merchant conversion webhooks (0 = send inline)",
+    )
+    simulate_delay_seconds: float = Field(
+        default=0.5,
+        description="Simulated payment processing delay in merchant checkout (<= 0 disables it)",
+    )
 
 
 
@@ -85,34 +99,77 @@ class Config(BaseSettings):
         extra = "ignore"
 
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, parsing the environment once."""
+    return Config()
+
+
 # Global config instance
-config = Config()
+config = get_config()
 
 
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Immutable snapshot of the settings the demo agents read at runtime.
+
+    Built once from the validated ``Config``; reads are plain slot lookups.
+    """
+
+    resource_url: str
+    svm_private_key: str = field(repr=False)
+    evm_private_key: str = field(repr=False)
+    content_price_usd: float
+    log_level: str
+
+
+@lru_cache(maxsize=1)
+def get_runtime_config() -> RuntimeConfig:
+    """Return the process-wide RuntimeConfig."""
+    source = get_config()
+    return RuntimeConfig(**{f.name: getattr(source, f.name) for f in fields(RuntimeConfig)})
+
+
+# Per service: groups of settings of which at least one must be set, with the
+# error reported when none of them is.
+_WALLET_ADDRESS = (
+    ("evm_address", "svm_address"),
+    "Either EVM_ADDRESS or SVM_ADDRESS must be set",
+)
+_REQUIREMENTS: dict[str, tuple[tuple[tuple[str, ...], str], ...]] = {
+    "resource": (_WALLET_ADDRESS,),
+    "agent": (_WALLET_ADDRESS,),
+    "pincer": (
+        (
+            ("treasury_evm_address", "treasury_svm_address"),
+            "Either TREASURY_EVM_ADDRESS or TREASURY_SVM_ADDRESS must be set for Pincer service",
+        ),
+        (
+            ("treasury_evm_private_key", "treasury_svm_private_key"),
+            "Either TREASURY_EVM_PRIVATE_KEY or TREASURY_SVM_PRIVATE_KEY must be set for Pincer service",
+        ),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
 def validate_config_for_service(service: Literal["resource", "pincer", "merchant", "agent"]) -> None:
     """Validate that required configuration is present for a specific service.
 
+    A successful check is cached per service for the life of the process
+    (``config`` is built once at import); failures are not cached.
+
     Args:
         service: The service name to validate configuration for.
 
     Raises:
         ValueError: If required configuration is missing.
     """
-    errors = []
-
-    if service in ["resource", "agent"]:
-        if not config.evm_address and not config.svm_address:
-            errors.append("Either EVM_ADDRESS or SVM_ADDRESS must be set")
-
-    if service == "pincer":
-        if not config.treasury_evm_address and not config.treasury_svm_address:
-            errors.append(
-                "Either TREASURY_EVM_ADDRESS or TREASURY_SVM_ADDRESS must be set for Pincer service"
-            )
-        if not config.treasury_evm_private_key and not config.treasury_svm_private_key:
-            errors.append(
-                "Either TREASURY_EVM_PRIVATE_KEY or TREASURY_SVM_PRIVATE_KEY must be set for Pincer service"
-            )
+    errors = [
+        message
+        for group, message in _REQUIREMENTS.get(service, ())
+        if not any(getattr(config, name) for name in group)
+    ]
 
     if errors:
         error_msg = f"Configuration errors for {service} service:\n" + "\n".join(f"  - {e}" for e in errors)
@@ -7,8 +7,12 @@ support for idempotency and anti-replay protection.
 import asyncio
 import json
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
 
 import aiosqlite
 
@@ -23,7 +27,8 @@ from .models import (
 
 logger = get_logger(__name__)
 
-# SQL Schema
+# SQL Schema (timestamps are INTEGER microseconds since the Unix epoch, UTC;
+# money columns are INTEGER atomic units, see ATOMIC_DECIMALS)
 SCHEMA_SQL = """
 -- Sponsor campaigns table
 CREATE TABLE IF NOT EXISTS campaigns (
@@ -31,17 +36,17 @@ CREATE TABLE IF NOT EXISTS campaigns (
     merchant_name TEXT NOT NULL,
     offer_text TEXT NOT NULL,
     
-    rebate_amount REAL NOT NULL,
+    rebate_amount INTEGER NOT NULL,
     rebate_asset TEXT NOT NULL,
     rebate_network TEXT NOT NULL,
     
-    budget_total REAL NOT NULL,
-    budget_remaining REAL NOT NULL,
+    budget_total INTEGER NOT NULL,
+    budget_remaining INTEGER NOT NULL,
     budget_asset TEXT NOT NULL,
     
     active INTEGER NOT NULL DEFAULT 1,
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
 );
 
 -- Payment sessions table (for anti-replay protection)
@@ -50,11 +55,11 @@ CREATE TABLE IF NOT EXISTS sessions (
     user_address TEXT NOT NULL,
     network TEXT NOT NULL,
     
-    amount_paid REAL NOT NULL,
+    amount_paid INTEGER NOT NULL,
     payment_asset TEXT NOT NULL,
     
     payment_hash TEXT,
-    verified_at TEXT NOT NULL,
+    verified_at INTEGER NOT NULL,
     rebate_settled INTEGER NOT NULL DEFAULT 0,
     correlation_id TEXT
 );
@@ -65,8 +70,8 @@ CREATE TABLE IF NOT EXISTS webhooks (
     session_id TEXT NOT NULL,
     user_address TEXT NOT NULL,
     status TEXT NOT NULL CHECK(status IN ('processing', 'completed', 'failed')),
-    received_at TEXT NOT NULL,
-    processed_at TEXT,
+    received_at INTEGER NOT NULL,
+    processed_at INTEGER,
     error_message TEXT,
     rebate_tx_hash TEXT,
     FOREIGN KEY (session_id) REFERENCES sessions(session_id)
@@ -79,15 +84,15 @@ CREATE TABLE IF NOT EXISTS settlements (
     webhook_id TEXT NOT NULL,
     user_address TEXT NOT NULL,
     
-    rebate_amount REAL NOT NULL,
+    rebate_amount INTEGER NOT NULL,
     rebate_asset TEXT NOT NULL,
     
     network TEXT NOT NULL,
     tx_hash TEXT,
     status TEXT NOT NULL CHECK(status IN ('pending', 'confirmed', 'failed')),
     campaign_id TEXT NOT NULL,
-    settled_at TEXT NOT NULL,
-    confirmed_at TEXT,
+    settled_at INTEGER NOT NULL,
+    confirmed_at INTEGER,
     correlation_id TEXT,
     FOREIGN KEY (session_id) REFERENCES sessions(session_id),
     FOREIGN KEY (webhook_id) REFERENCES webhooks(webhook_id),
@@ -103,6 +108,264 @@ CREATE INDEX IF NOT EXISTS idx_settlements_session_id ON settlements(session_id)
 CREATE INDEX IF NOT EXISTS idx_settlements_webhook_id ON settlements(webhook_id);
 """
 
+# Bumped whenever stored data changes shape; see _migrate()
+SCHEMA_VERSION = 2
+
+# Money is stored in the asset's smallest unit (USDC has 6 decimals), so
+# budget arithmetic in SQL is exact integer math.
+ATOMIC_DECIMALS = 6
+
+# Version 0 stored timestamps as ISO-8601 text and version 1 stored money
+# as REAL. Tables are rebuilt because a column's declared type fixes its
+# affinity: an integer written into a TEXT column would be read back as a
+# string, and an INTEGER column keeps non-integral REAL values as REAL.
+_US_FROM_ISO = (
+    "CAST(strftime('%s', {0}) AS INTEGER) * 1000000"
+    " + CAST(substr({0} || '000000', 21, 6) AS INTEGER)"
+)
+_ATOMIC_FROM_REAL = f"CAST(round({{0}} * {10 ** ATOMIC_DECIMALS}) AS INTEGER)"
+
+
+def _rebuild_sql(ts: str, money: str) -> str:
+    """Script that rebuilds all tables as SCHEMA_SQL, converting old columns.
+
+    ``ts`` and ``money`` are SQL templates applied to every timestamp and
+    money column of the old tables (``"{0}"`` copies the value as is).
+    """
+    t = ts.format
+    m = money.format
+    return f"""
+ALTER TABLE campaigns RENAME TO campaigns_old;
+ALTER TABLE sessions RENAME TO sessions_old;
+ALTER TABLE webhooks RENAME TO webhooks_old;
+ALTER TABLE settlements RENAME TO settlements_old;
+{SCHEMA_SQL}
+INSERT INTO campaigns
+SELECT campaign_id, merchant_name, offer_text,
+       {m("rebate_amount")}, rebate_asset, rebate_network,
+       {m("budget_total")}, {m("budget_remaining")}, budget_asset, active,
+       {t("created_at")}, {t("updated_at")}
+FROM campaigns_old;
+INSERT INTO sessions
+SELECT session_id, user_address, network, {m("amount_paid")}, payment_asset, payment_hash,
+       {t("verified_at")}, rebate_settled, correlation_id
+FROM sessions_old;
+INSERT INTO webhooks
+SELECT webhook_id, session_id, user_address, status,
+       {t("received_at")}, {t("processed_at")},
+       error_message, rebate_tx_hash
+FROM webhooks_old;
+INSERT INTO settlements
+SELECT settlement_id, session_id, webhook_id, user_address,
+       {m("rebate_amount")}, rebate_asset, network, tx_hash, status, campaign_id,
+       {t("settled_at")}, {t("confirmed_at")},
+       correlation_id
+FROM settlements_old;
+DROP TABLE settlements_old;
+DROP TABLE webhooks_old;
+DROP TABLE sessions_old;
+DROP TABLE campaigns_old;
+"""
+
+
+# Upgrade scripts keyed by the version they start from; each goes straight
+# to SCHEMA_VERSION.
+MIGRATIONS = {
+    0: _rebuild_sql(_US_FROM_ISO, _ATOMIC_FROM_REAL),
+    1: _rebuild_sql("{0}", _ATOMIC_FROM_REAL),
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _now_us() -> int:
+    """Current time in microseconds since the Unix epoch."""
+    return time.time_ns() // 1000
+
+
+def _dt_to_us(dt: datetime) -> int:
+    """Convert a datetime (naive values are taken as UTC) to epoch microseconds."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+def _us_to_dt(us: int) -> datetime:
+    """Convert epoch microseconds back to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _to_atomic(amount: float, decimals: int = ATOMIC_DECIMALS) -> int:
+    """Convert a decimal amount to integer atomic units."""
+    return round(amount * 10**decimals)
+
+
+def _from_atomic(units: int, decimals: int = ATOMIC_DECIMALS) -> float:
+    """Convert integer atomic units back to a decimal amount."""
+    return units / 10**decimals
+
+
+# Explicit column lists: rows come back as plain tuples, so the row adapters
+# below unpack by position and depend on this order.
+CAMPAIGN_COLS = (
+    "campaign_id, merchant_name, offer_text, rebate_amount, rebate_asset, "
+    "rebate_network, budget_total, budget_remaining, budget_asset, active, created_at"
+)
+SESSION_COLS = (
+    "session_id, user_address, network, amount_paid, payment_asset, "
+    "payment_hash, verified_at, rebate_settled, correlation_id"
+)
+WEBHOOK_COLS = (
+    "webhook_id, session_id, user_address, status, received_at, "
+    "processed_at, error_message, rebate_tx_hash"
+)
+
+
+def _row_to_campaign(row: tuple) -> SponsorCampaign:
+    """Build a SponsorCampaign from a CAMPAIGN_COLS row."""
+    (
+        campaign_id, merchant_name, offer_text, rebate_amount, rebate_asset,
+        rebate_network, budget_total, budget_remaining, budget_asset, active, created_at,
+    ) = row
+    return SponsorCampaign(
+        campaign_id=campaign_id,
+        merchant_name=merchant_name,
+        offer_text=offer_text,
+        rebate_amount=_from_atomic(rebate_amount),
+        rebate_asset=rebate_asset,
+        rebate_network=rebate_network,
+        budget_total=_from_atomic(budget_total),
+        budget_remaining=_from_atomic(budget_remaining),
+        budget_asset=budget_asset,
+        active=bool(active),
+        created_at=_us_to_dt(created_at),
+    )
+
+
+def _row_to_session(row: tuple) -> PaymentSession:
+    """Build a PaymentSession from a SESSION_COLS row."""
+    (
+        session_id, user_address, network, amount_paid, payment_asset,
+        payment_hash, verified_at, rebate_settled, correlation_id,
+    ) = row
+    return PaymentSession(
+        session_id=session_id,
+        user_address=user_address,
+        network=network,
+        amount_paid=_from_atomic(amount_paid),
+        payment_asset=payment_asset,
+        payment_hash=payment_hash,
+        verified_at=_us_to_dt(verified_at),
+        rebate_settled=bool(rebate_settled),
+        correlation_id=correlation_id,
+    )
+
+
+def _row_to_webhook(row: tuple) -> WebhookRecord:
+    """Build a WebhookRecord from a WEBHOOK_COLS row."""
+    (
+        webhook_id, session_id, user_address, status, received_at,
+        processed_at, error_message, rebate_tx_hash,
+    ) = row
+    return WebhookRecord(
+        webhook_id=webhook_id,
+        session_id=session_id,
+        user_address=user_address,
+        status=status,
+        received_at=_us_to_dt(received_at),
+        processed_at=_us_to_dt(processed_at) if processed_at else None,
+        error_message=error_message,
+        rebate_tx_hash=rebate_tx_hash,
+    )
+
+
+# Per-connection tuning. journal_mode=WAL is stored in the database file and
+# set once when the writer connection opens; these reset on every connection.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Read-only connections kept open alongside the single writer
+READ_POOL_SIZE = 4
+# sqlite3's per-connection prepared-statement cache (default 128)
+CACHED_STATEMENTS = 256
+# Seconds before the campaign cache re-reads the table, so edits made by
+# other processes (init_ledger, manual SQL) are eventually picked up
+CAMPAIGN_CACHE_TTL = 30.0
+# Settled sessions kept in memory for repeat anti-replay lookups
+SESSION_CACHE_SIZE = 1024
+# Seconds between passive WAL checkpoints, keeping the -wal file short
+CHECKPOINT_INTERVAL = 60.0
+
+# Statements are module constants so every call passes the same string and
+# hits the prepared-statement cache instead of re-parsing.
+SQL_INSERT_CAMPAIGN = """
+INSERT OR IGNORE INTO campaigns
+(campaign_id, merchant_name, offer_text,
+ rebate_amount, rebate_asset, rebate_network,
+ budget_total, budget_remaining, budget_asset,
+ active, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_GET_CAMPAIGNS = f"SELECT {CAMPAIGN_COLS} FROM campaigns"
+
+SQL_RESERVE_BUDGET = """
+UPDATE campaigns
+SET budget_remaining = budget_remaining - ?, updated_at = ?
+WHERE campaign_id = ? AND active = 1 AND budget_remaining >= ?
+RETURNING budget_remaining
+"""
+
+SQL_GET_CAMPAIGN_BUDGET = "SELECT budget_remaining, active FROM campaigns WHERE campaign_id = ?"
+
+SQL_INSERT_SESSION = """
+INSERT INTO sessions
+(session_id, user_address, network, amount_paid, payment_asset,
+ payment_hash, verified_at, rebate_settled, correlation_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_GET_SESSION = f"SELECT {SESSION_COLS} FROM sessions WHERE session_id = ?"
+
+SQL_MARK_SESSION_SETTLED = "UPDATE sessions SET rebate_settled = 1 WHERE session_id = ?"
+
+SQL_INSERT_WEBHOOK = """
+INSERT INTO webhooks
+(webhook_id, session_id, user_address, status, received_at,
+ processed_at, error_message, rebate_tx_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(webhook_id) DO NOTHING
+"""
+
+SQL_GET_WEBHOOK = f"SELECT {WEBHOOK_COLS} FROM webhooks WHERE webhook_id = ?"
+
+SQL_UPDATE_WEBHOOK_STATUS = """
+UPDATE webhooks
+SET status = ?, processed_at = ?, error_message = ?, rebate_tx_hash = ?
+WHERE webhook_id = ?
+"""
+
+SQL_INSERT_SETTLEMENT = """
+INSERT INTO settlements
+(settlement_id, session_id, webhook_id, user_address,
+ rebate_amount, rebate_asset, network, tx_hash, status,
+ campaign_id, settled_at, confirmed_at, correlation_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_UPDATE_SETTLEMENT = (
+    "UPDATE settlements SET status = ?, confirmed_at = ? WHERE settlement_id = ?"
+)
+
+SQL_UPDATE_SETTLEMENT_WITH_TX = (
+    "UPDATE settlements SET status = ?, confirmed_at = ?, tx_hash = ? WHERE settlement_id = ?"
+)
+
 
 class Database:
     """Async database interface for Pincer ledger."""
@@ -114,14 +377,178 @@ class Database:
             db_path: Path to SQLite database file. Defaults to config.database_path.
         """
         self.db_path = db_path or config.database_path
-        self._lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._write_conn: Optional[aiosqlite.Connection] = None
+        self._read_pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+        self._open_lock = asyncio.Lock()
+        self._campaign_cache: Optional[Dict[str, SponsorCampaign]] = None
+        self._campaign_cache_expires = 0.0
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        # Only settled sessions are cached: rebate_settled never reverts, so
+        # these entries cannot go stale and need no TTL
+        self._settled_sessions: "OrderedDict[str, PaymentSession]" = OrderedDict()
 
-    async def initialize(self) -> None:
-        """Initialize database schema."""
-        async with aiosqlite.connect(self.db_path) as db:
+    def _read_only_uri(self) -> Optional[str]:
+        """Return a read-only URI for the database file.
+
+        Returns None for ``:memory:`` and URI paths, which get no reader pool.
+        """
+        if self.db_path == ":memory:" or self.db_path.startswith("file:"):
+            return None
+        return f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+
+    async def _open_connection(self, database: str, **kwargs) -> aiosqlite.Connection:
+        """Open a connection with the tuning PRAGMAs applied (rows stay plain tuples)."""
+        conn = await aiosqlite.connect(
+            database, cached_statements=CACHED_STATEMENTS, **kwargs
+        )
+        try:
+            for pragma in CONNECTION_PRAGMAS:
+                await conn.execute(pragma)
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def _open(self) -> None:
+        """Open the writer and the read-only pool on first use.
+
+        Long-lived connections keep SQLite's page cache warm and avoid
+        spawning a worker thread and reopening the file on every call. Under
+        WAL, readers see the last committed snapshot without waiting on the
+        writer, so reads run on their own connections in parallel.
+        """
+        if self._write_conn is not None:
+            return
+        async with self._open_lock:
+            if self._write_conn is not None:
+                return
+            opened: List[aiosqlite.Connection] = []
+            try:
+                writer = await self._open_connection(self.db_path)
+                opened.append(writer)
+                # Schema and WAL switch are committed before any reader attaches
+                await writer.execute("PRAGMA journal_mode=WAL")
+                # The FOREIGN KEY clauses document relationships only; the
+                # webhook flow validates references itself, so inserts skip
+                # the parent-row probes. Pinned off in case the library
+                # default ever changes.
+                await writer.execute("PRAGMA foreign_keys=OFF")
+                await self._migrate(writer)
+
+                pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+                read_uri = self._read_only_uri()
+                if read_uri is not None:
+                    pool = asyncio.Queue()
+                    for _ in range(READ_POOL_SIZE):
+                        reader = await self._open_connection(read_uri, uri=True)
+                        opened.append(reader)
+                        # Also refuse writes at the statement level, not just the file
+                        await reader.execute("PRAGMA query_only=1")
+                        pool.put_nowait(reader)
+            except BaseException:
+                # aiosqlite threads are non-daemon; don't leak half a pool
+                for conn in opened:
+                    await conn.close()
+                raise
+            self._write_conn = writer
+            self._read_pool = pool
+            if pool is not None:
+                self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+
+    async def _checkpoint_loop(self) -> None:
+        """Periodically fold the WAL back into the database file.
+
+        PASSIVE never waits on readers; pages they still need are left for
+        the next round.
+        """
+        while True:
+            await asyncio.sleep(CHECKPOINT_INTERVAL)
+            try:
+                # On the writer, between transactions
+                async with self._writer() as db:
+                    async with db.execute("PRAGMA wal_checkpoint(PASSIVE)") as cursor:
+                        busy, log_pages, checkpointed = await cursor.fetchone()
+            except sqlite3.Error as e:
+                logger.warning("WAL checkpoint failed: %s", e)
+                continue
+            if busy:
+                logger.info(
+                    "WAL checkpoint busy: %s/%s pages checkpointed", checkpointed, log_pages
+                )
+
+    async def _migrate(self, db: aiosqlite.Connection) -> None:
+        """Create the schema, or upgrade an older database to SCHEMA_VERSION."""
+        async with db.execute("PRAGMA user_version") as cursor:
+            (version,) = await cursor.fetchone()
+        if version >= SCHEMA_VERSION:
             await db.executescript(SCHEMA_SQL)
-            await db.commit()
-        logger.info(f"Database initialized at {self.db_path}")
+            return
+
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'campaigns'"
+        ) as cursor:
+            has_tables = await cursor.fetchone() is not None
+
+        script = SCHEMA_SQL
+        if has_tables:
+            logger.info("Migrating ledger schema from version %s to %s", version, SCHEMA_VERSION)
+            # Dropping the old tables drops their indexes; SCHEMA_SQL recreates them
+            script = MIGRATIONS[version] + SCHEMA_SQL
+        try:
+            await db.executescript(
+                f"BEGIN;\n{script}\nPRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+            )
+        except Exception:
+            await db.rollback()
+            raise
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool."""
+        await self._open()
+        if self._read_pool is None:
+            yield self._write_conn
+            return
+        conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def _writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the write lock and yield the single write connection."""
+        await self._open()
+        async with self._write_lock:
+            yield self._write_conn
+
+    async def initialize(self) -> None:
+        """Initialize database schema in WAL mode.
+
+        WAL lets readers proceed while a write is in progress and turns each
+        commit into a log append instead of a rollback-journal fsync.
+        """
+        await self._open()
+        logger.info("Database initialized at %s", self.db_path)
+
+    async def close(self) -> None:
+        """Close the writer and every pooled reader."""
+        if self._write_conn is None:
+            return
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        if self._read_pool is not None:
+            while not self._read_pool.empty():
+                await self._read_pool.get_nowait().close()
+        await self._write_conn.close()
+        self._write_conn = None
+        self._read_pool = None
 
     async def initialize_campaigns(self) -> None:
         """Initialize sponsor campaigns from JSON config."""
@@ -129,110 +556,91 @@ class Database:
             with open(config.sponsor_data_path, "r") as f:
                 campaigns_data = json.load(f)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                for data in campaigns_data:
-                    # Convert JSON to model
-                    campaign = SponsorCampaign(
-                        campaign_id=data["id"],
-                        merchant_name=data["merchant_name"],
-                        offer_text=data["offer_text"],
-                        rebate_amount=data["rebate"]["amount"],
-                        rebate_asset=data["rebate"]["asset"],
-                        rebate_network=data["rebate"]["network"],
-                        budget_total=data["budget"]["total"],
-                        budget_remaining=data["budget"]["remaining"],
-                        budget_asset=data["budget"]["asset"],
-                        active=True,
-                        created_at=datetime.utcnow(),
+            # One clock read per batch, shared by every seeded row
+            now = _now_us()
+            created_at = _us_to_dt(now)
+            rows = []
+            for data in campaigns_data:
+                # Convert JSON to model
+                campaign = SponsorCampaign(
+                    campaign_id=data["id"],
+                    merchant_name=data["merchant_name"],
+                    offer_text=data["offer_text"],
+                    rebate_amount=data["rebate"]["amount"],
+                    rebate_asset=data["rebate"]["asset"],
+                    rebate_network=data["rebate"]["network"],
+                    budget_total=data["budget"]["total"],
+                    budget_remaining=data["budget"]["remaining"],
+                    budget_asset=data["budget"]["asset"],
+                    active=True,
+                    created_at=created_at,
+                )
+                rows.append(
+                    (
+                        campaign.campaign_id,
+                        campaign.merchant_name,
+                        campaign.offer_text,
+                        _to_atomic(campaign.rebate_amount),
+                        campaign.rebate_asset,
+                        campaign.rebate_network,
+                        _to_atomic(campaign.budget_total),
+                        _to_atomic(campaign.budget_remaining),
+                        campaign.budget_asset,
+                        1 if campaign.active else 0,
+                        _dt_to_us(campaign.created_at),
+                        now,
                     )
+                )
 
-                    # Check if campaign already exists
-                    cursor = await db.execute(
-                        "SELECT campaign_id FROM campaigns WHERE campaign_id = ?",
-                        (campaign.campaign_id,),
-                    )
-                    exists = await cursor.fetchone()
-
-                    if not exists:
-                        await db.execute(
-                            """
-                            INSERT INTO campaigns 
-                            (campaign_id, merchant_name, offer_text, 
-                             rebate_amount, rebate_asset, rebate_network,
-                             budget_total, budget_remaining, budget_asset,
-                             active, created_at, updated_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                campaign.campaign_id,
-                                campaign.merchant_name,
-                                campaign.offer_text,
-                                campaign.rebate_amount,
-                                campaign.rebate_asset,
-                                campaign.rebate_network,
-                                campaign.budget_total,
-                                campaign.budget_remaining,
-                                campaign.budget_asset,
-                                1 if campaign.active else 0,
-                                campaign.created_at.isoformat(),
-                                datetime.utcnow().isoformat(),
-                            ),
-                        )
-                        logger.info(f"Initialized campaign: {campaign.campaign_id}")
-                await db.commit()
+            # Existing campaigns are skipped by the primary key, in one transaction
+            async with self._writer() as db:
+                try:
+                    cursor = await db.executemany(SQL_INSERT_CAMPAIGN, rows)
+                    await db.commit()
+                except Exception:
+                    # Don't leave a half-seeded transaction for the next commit()
+                    await db.rollback()
+                    raise
+            logger.info("Initialized %s new campaign(s) of %s", cursor.rowcount, len(rows))
+            await self.reload_campaigns()
         except Exception as e:
-            logger.error(f"Failed to initialize campaigns: {e}")
+            logger.error("Failed to initialize campaigns: %s", e)
+
+    async def reload_campaigns(self) -> None:
+        """Reload the in-memory campaign cache from the database.
+
+        Call this after editing campaigns outside this ``Database`` instance;
+        otherwise such edits show up once the cache TTL expires.
+        """
+        # Read on the writer, under the write lock, so no reservation can
+        # commit between the read and the cache swap.
+        async with self._writer() as db:
+            campaigns = {}
+            async with db.execute(SQL_GET_CAMPAIGNS) as cursor:
+                # Stream rows instead of materializing them with fetchall()
+                async for row in cursor:
+                    campaign = _row_to_campaign(row)
+                    campaigns[campaign.campaign_id] = campaign
+            self._campaign_cache = campaigns
+            self._campaign_cache_expires = time.monotonic() + CAMPAIGN_CACHE_TTL
+
+    async def _campaigns(self) -> Dict[str, SponsorCampaign]:
+        """Return the campaign cache, reloading it when missing or expired."""
+        if self._campaign_cache is None or time.monotonic() >= self._campaign_cache_expires:
+            await self.reload_campaigns()
+        return self._campaign_cache
 
     async def get_campaign(self, campaign_id: str) -> Optional[SponsorCampaign]:
-        """Get sponsor campaign by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM campaigns WHERE campaign_id = ?", (campaign_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return SponsorCampaign(
-                        campaign_id=row["campaign_id"],
-                        merchant_name=row["merchant_name"],
-                        offer_text=row["offer_text"],
-                        rebate_amount=row["rebate_amount"],
-                        rebate_asset=row["rebate_asset"],
-                        rebate_network=row["rebate_network"],
-                        budget_total=row["budget_total"],
-                        budget_remaining=row["budget_remaining"],
-                        budget_asset=row["budget_asset"],
-                        active=bool(row["active"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                    )
-        return None
+        """Get sponsor campaign by ID (served from the campaign cache)."""
+        return (await self._campaigns()).get(campaign_id)
 
     async def get_active_campaigns(self) -> List[SponsorCampaign]:
-        """Get all active campaigns with sufficient budget."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM campaigns WHERE active = 1 AND budget_remaining >= rebate_amount"
-            ) as cursor:
-                rows = await cursor.fetchall()
-                campaigns = []
-                for row in rows:
-                    campaigns.append(
-                        SponsorCampaign(
-                            campaign_id=row["campaign_id"],
-                            merchant_name=row["merchant_name"],
-                            offer_text=row["offer_text"],
-                            rebate_amount=row["rebate_amount"],
-                            rebate_asset=row["rebate_asset"],
-                            rebate_network=row["rebate_network"],
-                            budget_total=row["budget_total"],
-                            budget_remaining=row["budget_remaining"],
-                            budget_asset=row["budget_asset"],
-                            active=bool(row["active"]),
-                            created_at=datetime.fromisoformat(row["created_at"]),
-                        )
-                    )
-                return campaigns
+        """Get all active campaigns with sufficient budget (served from the campaign cache)."""
+        return [
+            campaign
+            for campaign in (await self._campaigns()).values()
+            if campaign.active and campaign.budget_remaining >= campaign.rebate_amount
+        ]
 
     async def reserve_budget(self, campaign_id: str, amount: float) -> bool:
         """Reserve budget for a campaign (deduct from remaining).
@@ -244,210 +652,235 @@ class Database:
         Returns:
             True if budget was reserved, False if insufficient budget.
         """
-        async with self._lock:  # Simple mutex for budget updates
-            async with aiosqlite.connect(self.db_path) as db:
+        units = _to_atomic(amount)
+        async with self._writer() as db:
+            # One conditional UPDATE checks and deducts atomically
+            # RETURNING hands back the new balance; fetch before committing,
+            # since the statement only finishes stepping on fetch
+            try:
                 cursor = await db.execute(
-                    "SELECT budget_remaining, active FROM campaigns WHERE campaign_id = ?",
-                    (campaign_id,),
-                )
-                row = await cursor.fetchone()
-                
-                if not row:
-                    logger.warning(f"Campaign not found: {campaign_id}")
-                    return False
-                    
-                remaining, active = row
-                
-                if not active:
-                    logger.warning(f"Campaign inactive: {campaign_id}")
-                    return False
-                    
-                if remaining < amount:
-                    logger.warning(f"Insufficient budget for {campaign_id}: {remaining} < {amount}")
-                    return False
-                
-                # Deduct budget
-                await db.execute(
-                    """
-                    UPDATE campaigns 
-                    SET budget_remaining = budget_remaining - ?, updated_at = ?
-                    WHERE campaign_id = ?
-                    """,
-                    (amount, datetime.utcnow().isoformat(), campaign_id),
+                    SQL_RESERVE_BUDGET,
+                    (units, _now_us(), campaign_id, units),
                 )
+                updated = await cursor.fetchone()
                 await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            if updated is not None:
+                cached = self._campaign_cache and self._campaign_cache.get(campaign_id)
+                if cached:
+                    cached.budget_remaining = _from_atomic(updated[0])
                 return True
 
+            # Only the failure path reads the row back, to log why
+            cursor = await db.execute(SQL_GET_CAMPAIGN_BUDGET, (campaign_id,))
+            row = await cursor.fetchone()
+
+        if not row:
+            logger.warning("Campaign not found: %s", campaign_id)
+            return False
+        remaining, active = row
+        if not active:
+            logger.warning("Campaign inactive: %s", campaign_id)
+        else:
+            logger.warning(
+                "Insufficient budget for %s: %s < %s", campaign_id, _from_atomic(remaining), amount
+            )
+        return False
+
     async def create_session(self, session: PaymentSession) -> None:
         """Create a new payment session record."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._writer() as db:
             try:
                 await db.execute(
-                    """
-                    INSERT INTO sessions 
-                    (session_id, user_address, network, amount_paid, payment_asset,
-                     payment_hash, verified_at, rebate_settled, correlation_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    SQL_INSERT_SESSION,
                     (
                         session.session_id,
                         session.user_address,
                         session.network,
-                        session.amount_paid,
+                        _to_atomic(session.amount_paid),
                         session.payment_asset,
                         session.payment_hash,
-                        session.verified_at.isoformat(),
+                        _dt_to_us(session.verified_at),
                         1 if session.rebate_settled else 0,
                         session.correlation_id,
                     ),
                 )
                 await db.commit()
             except sqlite3.IntegrityError:
-                logger.warning(f"Session already exists: {session.session_id}")
+                # Close the implicit transaction on the shared connection
+                await db.rollback()
+                logger.warning("Session already exists: %s", session.session_id)
 
     async def get_session(self, session_id: str) -> Optional[PaymentSession]:
-        """Get payment session by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
-            ) as cursor:
+        """Get payment session by ID.
+
+        Settled sessions are served from an in-memory LRU after the first
+        read, so replayed webhooks skip the database.
+        """
+        cached = self._settled_sessions.get(session_id)
+        if cached is not None:
+            self._settled_sessions.move_to_end(session_id)
+            return cached
+        async with self._reader() as db:
+            async with db.execute(SQL_GET_SESSION, (session_id,)) as cursor:
                 row = await cursor.fetchone()
-                if row:
-                    return PaymentSession(
-                        session_id=row["session_id"],
-                        user_address=row["user_address"],
-                        network=row["network"],
-                        amount_paid=row["amount_paid"],
-                        payment_asset=row["payment_asset"],
-                        payment_hash=row["payment_hash"],
-                        verified_at=datetime.fromisoformat(row["verified_at"]),
-                        rebate_settled=bool(row["rebate_settled"]),
-                        correlation_id=row["correlation_id"],
-                    )
-        return None
+        if not row:
+            return None
+        session = _row_to_session(row)
+        if session.rebate_settled:
+            self._settled_sessions[session_id] = session
+            if len(self._settled_sessions) > SESSION_CACHE_SIZE:
+                self._settled_sessions.popitem(last=False)
+        return session
 
     async def mark_session_settled(self, session_id: str) -> None:
         """Mark a session as having its rebate settled."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "UPDATE sessions SET rebate_settled = 1 WHERE session_id = ?",
-                (session_id,),
-            )
-            await db.commit()
+        async with self._writer() as db:
+            try:
+                await db.execute(SQL_MARK_SESSION_SETTLED, (session_id,))
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def create_webhook(self, webhook: WebhookRecord) -> bool:
+        """Create a new webhook tracking record.
 
-    async def create_webhook(self, webhook: WebhookRecord) -> None:
-        """Create a new webhook tracking record."""
-        async with aiosqlite.connect(self.db_path) as db:
+        Returns:
+            True if the record was inserted, False if the webhook ID already exists.
+        """
+        async with self._writer() as db:
             try:
-                await db.execute(
-                    """
-                    INSERT INTO webhooks 
-                    (webhook_id, session_id, user_address, status, received_at, 
-                     processed_at, error_message, rebate_tx_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                cursor = await db.execute(
+                    SQL_INSERT_WEBHOOK,
                     (
                         webhook.webhook_id,
                         webhook.session_id,
                         webhook.user_address,
                         webhook.status,
-                        webhook.received_at.isoformat(),
-                        webhook.processed_at.isoformat() if webhook.processed_at else None,
+                        _dt_to_us(webhook.received_at),
+                        _dt_to_us(webhook.processed_at) if webhook.processed_at else None,
                         webhook.error_message,
                         webhook.rebate_tx_hash,
                     ),
                 )
                 await db.commit()
-            except sqlite3.IntegrityError:
-                logger.warning(f"Webhook already exists: {webhook.webhook_id}")
+            except Exception:
+                await db.rollback()
+                raise
+        if cursor.rowcount != 1:
+            logger.warning("Webhook already exists: %s", webhook.webhook_id)
+            return False
+        return True
 
     async def get_webhook(self, webhook_id: str) -> Optional[WebhookRecord]:
         """Get webhook record by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM webhooks WHERE webhook_id = ?", (webhook_id,)
-            ) as cursor:
+        async with self._reader() as db:
+            async with db.execute(SQL_GET_WEBHOOK, (webhook_id,)) as cursor:
                 row = await cursor.fetchone()
                 if row:
-                    return WebhookRecord(
-                        webhook_id=row["webhook_id"],
-                        session_id=row["session_id"],
-                        user_address=row["user_address"],
-                        status=row["status"],
-                        received_at=datetime.fromisoformat(row["received_at"]),
-                        processed_at=datetime.fromisoformat(row["processed_at"]) if row["processed_at"] else None,
-                        error_message=row["error_message"],
-                        rebate_tx_hash=row["rebate_tx_hash"],
-                    )
-        return None
+                    return _row_to_webhook(row)
+            return None
 
     async def update_webhook_status(self, webhook_id: str, status: str, error: Optional[str] = None, tx_hash: Optional[str] = None) -> None:
         """Update webhook status."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                UPDATE webhooks 
-                SET status = ?, processed_at = ?, error_message = ?, rebate_tx_hash = ?
-                WHERE webhook_id = ?
-                """,
-                (
-                    status,
-                    datetime.utcnow().isoformat(),
-                    error,
-                    tx_hash,
-                    webhook_id,
-                ),
-            )
-            await db.commit()
+        async with self._writer() as db:
+            try:
+                await db.execute(
+                    SQL_UPDATE_WEBHOOK_STATUS,
+                    (
+                        status,
+                        _now_us(),
+                        error,
+                        tx_hash,
+                        webhook_id,
+                    ),
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
     async def create_settlement(self, settlement: RebateSettlement) -> None:
         """Create a new settlement record."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO settlements 
-                (settlement_id, session_id, webhook_id, user_address, 
-                 rebate_amount, rebate_asset, network, tx_hash, status, 
-                 campaign_id, settled_at, confirmed_at, correlation_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    settlement.settlement_id,
-                    settlement.session_id,
-                    settlement.webhook_id,
-                    settlement.user_address,
-                    settlement.rebate_amount,
-                    settlement.rebate_asset,
-                    settlement.network,
-                    settlement.tx_hash,
-                    settlement.status,
-                    settlement.campaign_id,
-                    settlement.settled_at.isoformat(),
-                    settlement.confirmed_at.isoformat() if settlement.confirmed_at else None,
-                    settlement.correlation_id,
-                ),
-            )
-            await db.commit()
+        async with self._writer() as db:
+            try:
+                await db.execute(
+                    SQL_INSERT_SETTLEMENT,
+                    (
+                        settlement.settlement_id,
+                        settlement.session_id,
+                        settlement.webhook_id,
+                        settlement.user_address,
+                        _to_atomic(settlement.rebate_amount),
+                        settlement.rebate_asset,
+                        settlement.network,
+                        settlement.tx_hash,
+                        settlement.status,
+                        settlement.campaign_id,
+                        _dt_to_us(settlement.settled_at),
+                        _dt_to_us(settlement.confirmed_at) if settlement.confirmed_at else None,
+                        settlement.correlation_id,
+                    ),
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def record_settlement_result(
+        self,
+        settlement_id: str,
+        session_id: str,
+        webhook_id: str,
+        tx_hash: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a payout outcome on the settlement, session and webhook at once.
+
+        On success (no ``error``) the settlement is confirmed, the session is
+        marked settled and the webhook completed; otherwise the settlement and
+        webhook are marked failed. Everything commits in one transaction, so
+        the flow pays for one commit and cannot stop half-recorded.
+        """
+        now = _now_us()
+        async with self._writer() as db:
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                if error is None:
+                    await db.execute(
+                        SQL_UPDATE_SETTLEMENT_WITH_TX, ("confirmed", now, tx_hash, settlement_id)
+                    )
+                    await db.execute(SQL_MARK_SESSION_SETTLED, (session_id,))
+                    await db.execute(
+                        SQL_UPDATE_WEBHOOK_STATUS, ("completed", now, None, tx_hash, webhook_id)
+                    )
+                else:
+                    await db.execute(SQL_UPDATE_SETTLEMENT, ("failed", now, settlement_id))
+                    await db.execute(
+                        SQL_UPDATE_WEBHOOK_STATUS, ("failed", now, error, None, webhook_id)
+                    )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
     async def update_settlement_status(self, settlement_id: str, status: str, tx_hash: Optional[str] = None) -> None:
         """Update settlement status."""
-        async with aiosqlite.connect(self.db_path) as db:
-            updates = ["status = ?", "confirmed_at = ?"]
-            params = [status, datetime.utcnow().isoformat()]
-            
-            if tx_hash:
-                updates.append("tx_hash = ?")
-                params.append(tx_hash)
-                
-            params.append(settlement_id)
-            
-            await db.execute(
-                f"UPDATE settlements SET {', '.join(updates)} WHERE settlement_id = ?",
-                tuple(params),
-            )
-            await db.commit()
+        now = _now_us()
+        if tx_hash:
+            sql, params = SQL_UPDATE_SETTLEMENT_WITH_TX, (status, now, tx_hash, settlement_id)
+        else:
+            sql, params = SQL_UPDATE_SETTLEMENT, (status, now, settlement_id)
+        async with self._writer() as db:
+            try:
+                await db.execute(sql, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
 
 # Global database instance
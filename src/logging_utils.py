@@ -10,9 +10,14 @@ import uuid
 from contextvars import ContextVar
 from typing import Optional
 
+import orjson
+
 # Context variable to store correlation ID for the current request/task
 correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Handler installed by setup_logging and the (level, format) it was built for
+_installed: Optional[tuple[logging.Handler, str, str]] = None
+
 
 class CorrelationIdFilter(logging.Filter):
     """Add correlation ID to log records."""
@@ -30,17 +35,59 @@ class CorrelationIdFilter(logging.Filter):
         return True
 
 
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object, escaped by orjson."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as a JSON line.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            The JSON-encoded record.
+        """
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "correlation_id": getattr(record, "correlation_id", "no-correlation-id"),
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
 def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     """Configure logging for the application.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
         log_format: Log format (json or text).
+
+    Repeated calls with the same arguments are no-ops while the handler from
+    the first call is still attached to the root logger.
     """
+    global _installed
+
     # Create logger
     logger = logging.getLogger()
+    if _installed is not None:
+        installed_handler, installed_level, installed_format = _installed
+        if (
+            installed_handler in logger.handlers
+            and installed_level == log_level.upper()
+            and installed_format == log_format
+        ):
+            return
     logger.setLevel(getattr(logging, log_level.upper()))
 
+    # No formatter here uses process/thread fields; skip collecting them per record
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -50,11 +97,7 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
 
     # Set format
     if log_format == "json":
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"correlation_id": "%(correlation_id)s", "name": "%(name)s", '
-            '"message": "%(message)s"}'
-        )
+        formatter = JsonFormatter()
     else:
         formatter = logging.Formatter(
             "%(asctime)s [%(levelname)s] [%(correlation_id)s] %(name)s: %(message)s"
@@ -66,6 +109,7 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     handler.addFilter(CorrelationIdFilter())
 
     logger.addHandler(handler)
+    _installed = (handler, log_level.upper(), log_format)
 
 
 def set_correlation_id(correlation_id: str) -> None:
@@ -5,8 +5,10 @@ Simulates a merchant checkout flow and sends conversion webhooks to Pincer.
 
 import asyncio
 import uuid
+from contextlib import asynccontextmanager
+from typing import Literal
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, Request
 from pincer_sdk import PincerClient
 from pydantic import BaseModel
 
@@ -17,10 +19,31 @@ from src.logging_utils import get_logger, setup_logging
 setup_logging(config.log_level, config.log_format)
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the shared Pincer client; checkouts reuse its connection pool.
+
+    With webhook workers configured, conversions are queued and delivered in
+    the background, so checkout does not wait on Pincer. Warmup opens the
+    HTTP/2 connection to Pincer at startup rather than on the first checkout.
+    Leaving the context delivers any queued webhooks, then closes the client.
+    """
+    async with PincerClient(
+        base_url=config.pincer_url,
+        webhook_secret=config.webhook_secret,
+        conversion_workers=config.merchant_webhook_workers,
+        warmup=True,
+    ) as pincer:
+        app.state.pincer = pincer
+        yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Shake Shack Demo",
     description="Demo merchant server for Pincer x402 flow",
+    lifespan=lifespan,
 )
 
 
@@ -38,12 +61,11 @@ class CheckoutResponse(BaseModel):
     order_id: str
     purchase_amount: float
     webhook_sent: bool
+    webhook_status: Literal["sent", "queued", "failed"]
     webhook_id: str
     message: str
 
 
-
-
 @app.get("/health")
 async def health_check() -> dict:
     """Health check endpoint."""
@@ -51,11 +73,17 @@ async def health_check() -> dict:
 
 
 @app.post("/checkout", response_model=CheckoutResponse)
-async def checkout(request: CheckoutRequest) -> CheckoutResponse:
+async def checkout(
+    request: CheckoutRequest,
+    http_request: Request,
+    x_skip_delay: str = Header(None, alias="X-Skip-Delay"),
+) -> CheckoutResponse:
     """Simulate checkout and send conversion webhook to Pincer.
 
     Args:
         request: Checkout request with session_id and user_address.
+        http_request: Incoming HTTP request, used to reach the shared Pincer client.
+        x_skip_delay: "1" skips the simulated payment delay (for load tests).
 
     Returns:
         Checkout confirmation with webhook status.
@@ -64,40 +92,48 @@ async def checkout(request: CheckoutRequest) -> CheckoutResponse:
     webhook_id = f"wh-{uuid.uuid4().hex[:12]}"
 
     logger.info(
-        f"Processing checkout: order={order_id}, session={request.session_id}, "
-        f"user={request.user_address}, amount={request.purchase_amount:.2f}"
+        "Processing checkout: order=%s, session=%s, user=%s, amount=%.2f",
+        order_id,
+        request.session_id,
+        request.user_address,
+        request.purchase_amount,
     )
 
-    # Simulate payment processing delay
-    await asyncio.sleep(0.5)
+    # Report conversion using the client opened at startup (kept-alive connections)
+    pincer: PincerClient = http_request.app.state.pincer
+    result = await pincer.report_conversion(
+        session_id=request.session_id,
+        user_address=request.user_address,
+        purchase_amount=request.purchase_amount,
+        purchase_asset="USD",
+        merchant_id="shake-shack"
+    )
 
-    # Initialize Pincer Client
-    # In a real app, this should be initialized once globally or via dependency injection
-    async with PincerClient(
-        base_url=config.pincer_url,
-        webhook_secret=config.webhook_secret
-    ) as pincer:
-        
-        # Report conversion using SDK
-        result = await pincer.report_conversion(
-            session_id=request.session_id,
-            user_address=request.user_address,
-            purchase_amount=request.purchase_amount,
-            purchase_asset="USD",
-            merchant_id="shake-shack"
-        )
-        
-        webhook_sent = result.status == "success"
-        webhook_id = result.webhook_id or "unknown"
-        message = result.message or result.error or "Unknown result"
-
-        if webhook_sent:
-             logger.info(f"Webhook accepted by Pincer: {message}")
-        else:
-             logger.error(f"Webhook rejected by Pincer: {message}")
+    # Simulate payment processing delay, after the webhook is already on its way
+    if config.simulate_delay_seconds > 0 and x_skip_delay != "1":
+        await asyncio.sleep(config.simulate_delay_seconds)
+
+    # Only a delivery Pincer accepted counts as sent. A queued webhook has
+    # not been delivered yet; if delivery fails, the SDK worker logs it.
+    webhook_sent = result.status == "success"
+    webhook_id = result.webhook_id or "unknown"
+    message = result.message or result.error or "Unknown result"
+
+    if result.status == "queued":
+        logger.info("Webhook queued for Pincer: %s", webhook_id)
+        webhook_status = "queued"
+        outcome = "queued for delivery"
+    elif webhook_sent:
+        logger.info("Webhook accepted by Pincer: %s", message)
+        webhook_status = "sent"
+        outcome = "sent successfully"
+    else:
+        logger.error("Webhook rejected by Pincer: %s", message)
+        webhook_status = "failed"
+        outcome = "failed"
 
     response_message = (
-        f"Order confirmed! Webhook {'sent successfully' if webhook_sent else 'failed'}. "
+        f"Order confirmed! Webhook {outcome}. "
         f"Rebate should be processed shortly."
     )
 
@@ -105,6 +141,7 @@ async def checkout(request: CheckoutRequest) -> CheckoutResponse:
         order_id=order_id,
         purchase_amount=request.purchase_amount,
         webhook_sent=webhook_sent,
+        webhook_status=webhook_status,
         webhook_id=webhook_id,
         message=response_message,
     )
@@ -126,7 +163,9 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
-    logger.info(f"Starting Shake Shack merchant server on {config.merchant_host}:{config.merchant_port}")
+    logger.info(
+        "Starting Shake Shack merchant server on %s:%s", config.merchant_host, config.merchant_port
+    )
     uvicorn.run(
         app,
         host=config.merchant_host,
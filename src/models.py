@@ -3,12 +3,27 @@
 All Pydantic models used across services for type safety and validation.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware current UTC time (``datetime.utcnow`` is deprecated)."""
+    return datetime.now(timezone.utc)
+
+
+class Restaurant(BaseModel):
+    """Restaurant recommendation served by the resource server."""
+
+    name: str
+    cuisine: str
+    rating: float
+    price_level: int  # 1-4 ($-$$$$)
+    description: str
+
+
 class SponsorCampaign(BaseModel):
     """Sponsor campaign configuration."""
 
@@ -29,7 +44,7 @@ class SponsorCampaign(BaseModel):
     coupons: list["Coupon"] = Field(default_factory=list, description="Discount coupons")
     
     active: bool = Field(default=True, description="Whether campaign is active")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class Coupon(BaseModel):
@@ -75,7 +90,7 @@ class PaymentSession(BaseModel):
     payment_asset: str = Field(default="USDC", description="Asset used for payment")
     
     payment_hash: Optional[str] = Field(default=None, description="Transaction hash")
-    verified_at: datetime = Field(default_factory=datetime.utcnow)
+    verified_at: datetime = Field(default_factory=_utcnow)
     rebate_settled: bool = Field(default=False, description="Whether rebate has been settled")
     correlation_id: Optional[str] = Field(default=None, description="Correlation ID for tracing")
 
@@ -90,7 +105,7 @@ class ConversionWebhook(BaseModel):
     purchase_amount: float = Field(description="Purchase amount")
     purchase_asset: str = Field(default="USD", description="Purchase currency")
     
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     merchant_id: Optional[str] = Field(default=None, description="Merchant identifier")
 
 
@@ -101,7 +116,7 @@ class WebhookRecord(BaseModel):
     session_id: str
     user_address: str
     status: Literal["processing", "completed", "failed"] = Field(default="processing")
-    received_at: datetime = Field(default_factory=datetime.utcnow)
+    received_at: datetime = Field(default_factory=_utcnow)
     processed_at: Optional[datetime] = Field(default=None)
     error_message: Optional[str] = Field(default=None)
     rebate_tx_hash: Optional[str] = Field(default=None, description="Rebate transaction hash")
@@ -122,7 +137,7 @@ class RebateSettlement(BaseModel):
     tx_hash: Optional[str] = Field(default=None, description="Rebate transaction hash")
     status: Literal["pending", "confirmed", "failed"] = Field(default="pending")
     campaign_id: str = Field(description="Campaign that provided rebate")
-    settled_at: datetime = Field(default_factory=datetime.utcnow)
+    settled_at: datetime = Field(default_factory=_utcnow)
     confirmed_at: Optional[datetime] = Field(default=None)
     correlation_id: Optional[str] = Field(default=None)
 
@@ -3,13 +3,8 @@
 Supports both EVM (USDC on Base Sepolia) and SVM (SOL on Solana Devnet).
 """
 
-import sys
-from pathlib import Path
 from typing import Any, Dict
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.config import config
 from src.logging_utils import get_logger
 
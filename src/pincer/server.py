@@ -7,7 +7,7 @@ Main FastAPI application integrating:
 - Rebate settlement
 """
 
-import sys
+import asyncio
 import uuid
 from pathlib import Path
 
@@ -15,10 +15,6 @@ from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.responses import FileResponse, HTMLResponse
 from pydantic import BaseModel
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 from src.config import config, validate_config_for_service
 from src.database import db
 from src.logging_utils import (
@@ -74,6 +70,12 @@ async def startup():
     logger.info("Pincer service initialized")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the ledger connection."""
+    await db.close()
+
+
 @app.get("/health")
 async def health_check() -> dict:
     """Health check endpoint."""
@@ -145,7 +147,27 @@ async def verify_payment(request: X402VerifyRequest):
     Returns:
         Payment verification response in x402 format.
     """
-    
+    return await _verify_x402_request(request)
+
+
+@app.post("/verify_batch")
+async def verify_payment_batch(requests: list[X402VerifyRequest]):
+    """Verify several x402 payments in one round trip.
+
+    Used by SDK clients with batch verification enabled. Each item is verified
+    independently, exactly as by ``/verify``.
+
+    Args:
+        requests: List of x402 verify requests.
+
+    Returns:
+        List of verification responses, in request order.
+    """
+    return await asyncio.gather(*(_verify_x402_request(r) for r in requests))
+
+
+async def _verify_x402_request(request: X402VerifyRequest) -> dict:
+    """Verify a single x402 request and format the x402 response."""
     # Generate session_id from request data for tracking
     session_id = f"sess-{uuid.uuid4().hex[:12]}"
     
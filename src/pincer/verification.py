@@ -6,18 +6,11 @@ on-chain for both EVM (Base Sepolia) and SVM (Solana Devnet) networks.
 Based on: https://github.com/coinbase/x402/blob/main/examples/python/facilitator/basic/main.py
 """
 
-import sys
 import uuid
-from pathlib import Path
+from datetime import datetime, timezone
 
 from eth_account import Account
 from solders.keypair import Keypair
-
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from datetime import datetime
-
 from x402 import x402Facilitator
 from x402.mechanisms.evm import FacilitatorWeb3Signer
 from x402.mechanisms.evm.exact import register_exact_evm_facilitator
@@ -189,7 +182,7 @@ class PincerFacilitator:
                         amount_paid=amount_paid,
                         payment_asset=payment_asset,
                         payment_hash=str(uuid.uuid4()), # We don't have the hash easily here without digging into payload
-                        verified_at=datetime.utcnow(),
+                        verified_at=datetime.now(timezone.utc),
                         rebate_settled=False,
                         correlation_id=get_correlation_id(),
                     )
@@ -5,14 +5,10 @@ Implements idempotency, anti-replay protection, and rebate settlement orchestrat
 
 import hashlib
 import hmac
-import sys
 import uuid
-from pathlib import Path
+from functools import lru_cache
 from typing import Any, Dict
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.config import config
 from src.database import db
 from src.logging_utils import get_correlation_id, get_logger
@@ -25,6 +21,12 @@ from src.models import (
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """HMAC-SHA256 object pre-keyed with ``secret``, copied per signature."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
 def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
     """Verify HMAC-SHA256 signature for webhook authenticity.
 
@@ -36,11 +38,10 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
     Returns:
         True if signature is valid, False otherwise.
     """
-    expected_signature = hmac.new(
-        secret.encode(),
-        payload,
-        hashlib.sha256,
-    ).hexdigest()
+    # Copying the keyed template skips re-encoding and re-hashing the key
+    h = _hmac_template(secret).copy()
+    h.update(payload)
+    expected_signature = h.hexdigest()
 
     # Use constant-time comparison to prevent timing attacks
     return hmac.compare_digest(expected_signature, signature)
@@ -134,8 +135,7 @@ class WebhookHandler:
         )
 
         try:
-            await db.create_webhook(webhook_record)
-            created = True
+            created = await db.create_webhook(webhook_record)
         except Exception:
             created = False
         if not created:
@@ -148,8 +148,9 @@ class WebhookHandler:
             }
 
         # 3. Anti-replay check - has this session already been settled?
+        # Read only once this request owns the webhook ID, so the check sees
+        # any settlement committed before the claim.
         session = await db.get_session(webhook.session_id)
-
         if not session:
             error_msg = f"Payment session not found: {webhook.session_id}"
             logger.error(error_msg)
@@ -236,14 +237,11 @@ class WebhookHandler:
             if payout_result["status"] == "success":
                 # Update settlement with transaction hash
                 tx_hash = payout_result.get("tx_hash")
-                await db.update_settlement_status(settlement_id, "confirmed", tx_hash)
-
-                # Mark session as settled (anti-replay)
-                await db.mark_session_settled(webhook.session_id)
 
-                # Update webhook status
-                await db.update_webhook_status(
-                    webhook.webhook_id, "completed", tx_hash=tx_hash
+                # Confirm settlement, mark session settled (anti-replay) and
+                # complete the webhook in one transaction
+                await db.record_settlement_result(
+                    settlement_id, webhook.session_id, webhook.webhook_id, tx_hash=tx_hash
                 )
 
                 logger.info(
@@ -264,8 +262,9 @@ class WebhookHandler:
                 error_msg = payout_result.get("error", "Payout failed")
                 logger.error(f"Payout failed for {settlement_id}: {error_msg}")
 
-                await db.update_settlement_status(settlement_id, "failed")
-                await db.update_webhook_status(webhook.webhook_id, "failed", error_msg)
+                await db.record_settlement_result(
+                    settlement_id, webhook.session_id, webhook.webhook_id, error=error_msg
+                )
 
                 return {
                     "status": "error",
@@ -28,6 +28,7 @@ from src.logging_utils import (
     get_logger,
     setup_logging,
 )
+from src.models import Restaurant
 
 # Validate configuration
 validate_config_for_service("resource")
@@ -42,16 +43,6 @@ SVM_NETWORK: Network = config.svm_network  # type: ignore
 
 
 # Response schemas
-class Restaurant(BaseModel):
-    """Restaurant recommendation."""
-
-    name: str
-    cuisine: str
-    rating: float
-    price_level: int  # 1-4 ($-$$$$)
-    description: str
-
-
 class RecommendationsResponse(BaseModel):
     """Response containing restaurant recommendations."""
 
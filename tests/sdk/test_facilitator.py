@@ -0,0 +1,129 @@
+"""Unit tests for PincerFacilitatorClient."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from pincer_sdk.client import PincerClient
+from pincer_sdk.facilitator import PincerFacilitatorClient, _build_supported, verification_var
+
+SUPPORTED_SCHEMES = {
+    "kinds": [
+        {"x402Version": 2, "scheme": "exact", "network": "solana:devnet", "extra": {}},
+    ],
+    "extensions": [],
+    "signers": {},
+}
+
+MOCK_SPONSOR = {
+    "sponsor_id": "sp-123",
+    "merchant_name": "Test Sponsor",
+    "offer_text": "Test Offer",
+    "rebate_amount": 10.0,
+    "rebate_asset": "USDC",
+    "rebate_network": "solana:mainnet",
+    "coupons": [],
+    "checkout_url": "http://checkout",
+    "session_id": "sess-123",
+    "offer_id": "off-123",
+}
+
+
+@pytest.fixture
+async def pincer_client():
+    client = PincerClient(base_url="http://test.pincer")
+    yield client
+    await client.close()
+
+
+def test_get_supported_uses_predefined_schemes(pincer_client):
+    """Test that pre-defined schemes are served without any HTTP call."""
+    facilitator = PincerFacilitatorClient(pincer_client, supported_schemes=SUPPORTED_SCHEMES)
+
+    with patch("httpx.Client") as mock_sync_client:
+        first = facilitator.get_supported()
+        second = facilitator.get_supported()
+
+    mock_sync_client.assert_not_called()
+    assert first is second
+    assert first.kinds[0].network == "solana:devnet"
+
+
+def test_predefined_schemes_validated_once_per_content(pincer_client):
+    """Test that equal scheme dicts (in any key order) are validated once but not shared."""
+    reordered = {key: SUPPORTED_SCHEMES[key] for key in reversed(list(SUPPORTED_SCHEMES))}
+    _build_supported.cache_clear()
+
+    first = PincerFacilitatorClient(pincer_client, supported_schemes=SUPPORTED_SCHEMES)
+    second = PincerFacilitatorClient(pincer_client, supported_schemes=reordered)
+
+    assert _build_supported.cache_info().misses == 1
+    assert first.get_supported() == second.get_supported()
+    assert first.get_supported() is not second.get_supported()
+
+    first.get_supported().kinds.clear()
+    assert second.get_supported().kinds[0].network == "solana:devnet"
+
+
+@pytest.mark.asyncio
+async def test_get_supported_async_fetches_once(pincer_client):
+    """Test that the async variant uses the pooled client and fills the cache."""
+    facilitator = PincerFacilitatorClient(pincer_client)
+    response = MagicMock()
+    response.content = orjson.dumps(SUPPORTED_SCHEMES)
+
+    with patch.object(pincer_client._http, "get", AsyncMock(return_value=response)) as mock_get:
+        first = await facilitator.get_supported_async()
+        second = facilitator.get_supported()
+
+    mock_get.assert_awaited_once_with("/supported")
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_verify_parses_sponsors(pincer_client):
+    """Test that verify decodes the Pincer response and exposes sponsors."""
+    facilitator = PincerFacilitatorClient(pincer_client, supported_schemes=SUPPORTED_SCHEMES)
+    response = MagicMock()
+    response.content = orjson.dumps({"isValid": True, "payer": "payer-1", "sponsors": [MOCK_SPONSOR]})
+
+    with patch.object(pincer_client._http, "post", AsyncMock(return_value=response)) as mock_post:
+        result = await facilitator.verify({"payload": {}}, {"scheme": "exact"})
+
+    args, kwargs = mock_post.call_args
+    assert args[0] == "/verify"
+    assert orjson.loads(kwargs["content"]) == {
+        "paymentPayload": {"payload": {}},
+        "paymentRequirements": {"scheme": "exact"},
+    }
+    assert result.is_valid is True
+    assert result.payer == "payer-1"
+    assert result.sponsors[0].sponsor_id == "sp-123"
+    assert verification_var.get() is result
+
+
+@pytest.mark.asyncio
+async def test_batch_verify_coalesces_concurrent_calls():
+    """Test that concurrent verify calls share a single /verify_batch request."""
+    response = MagicMock()
+    response.content = orjson.dumps([
+        {"isValid": True, "payer": "payer-1", "sponsors": []},
+        {"isValid": False, "invalidReason": "bad signature", "payer": None},
+    ])
+
+    async with PincerClient(base_url="http://test.pincer", enable_batch_verify=True) as client:
+        facilitator = client.facilitator()
+        with patch.object(client._http, "post", AsyncMock(return_value=response)) as mock_post:
+            first, second = await asyncio.gather(
+                facilitator.verify({"id": 1}, {"scheme": "exact"}),
+                facilitator.verify({"id": 2}, {"scheme": "exact"}),
+            )
+
+    mock_post.assert_awaited_once()
+    args, kwargs = mock_post.call_args
+    assert args[0] == "/verify_batch"
+    assert [r["paymentPayload"] for r in orjson.loads(kwargs["content"])] == [{"id": 1}, {"id": 2}]
+    assert first.is_valid is True
+    assert second.is_valid is False
+    assert second.invalid_reason == "bad signature"
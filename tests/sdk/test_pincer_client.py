@@ -1,7 +1,10 @@
 """Unit tests for PincerClient."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from pincer_sdk.client import PincerClient
 
@@ -16,9 +19,9 @@ async def test_report_conversion_success(mock_httpx_client):
     """Test successful conversion reporting."""
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "status": "success"
-    }
+    })
     
     # Mock the client instance returned by AsyncClient()
     mock_client_instance = AsyncMock()
@@ -86,3 +89,140 @@ async def test_report_conversion_server_error(mock_httpx_client):
     
     assert response.status == "error"
     assert "Failed to report conversion: 500" in response.error
+
+@pytest.mark.asyncio
+async def test_report_conversion_non_str_detail_keys(mock_httpx_client):
+    """Test that details with non-string keys are sent, and unserializable ones error."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"status": "success"})
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.post.return_value = mock_response
+    mock_httpx_client.return_value = mock_client_instance
+
+    client = PincerClient(base_url="http://test.pincer", webhook_secret="test_secret")
+
+    response = await client.report_conversion(
+        session_id="sess-123", user_address="0xUser", purchase_amount=1.0, details={1: "x"}
+    )
+    assert response.status == "success"
+    sent = json.loads(mock_client_instance.post.call_args.kwargs["content"])
+    assert sent["1"] == "x"
+
+    response = await client.report_conversion(
+        session_id="sess-123", user_address="0xUser", purchase_amount=1.0, details={"x": object()}
+    )
+    assert response.status == "error"
+
+@pytest.mark.asyncio
+async def test_report_conversion_background_workers(mock_httpx_client):
+    """Test that queued conversions return immediately and are delivered on close."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"status": "success"})
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.post.return_value = mock_response
+    mock_httpx_client.return_value = mock_client_instance
+
+    async with PincerClient(
+        base_url="http://test.pincer",
+        webhook_secret="test_secret",
+        conversion_workers=2,
+    ) as client:
+        response = await client.report_conversion(
+            session_id="sess-123",
+            user_address="0xUser",
+            purchase_amount=100.0,
+        )
+        assert response.status == "queued"
+        assert response.webhook_id is not None
+
+    # Closing the client drains the queue
+    mock_client_instance.post.assert_called_once()
+    args, _ = mock_client_instance.post.call_args
+    assert args[0] == "/webhooks/conversion"
+
+@pytest.mark.asyncio
+async def test_conversion_worker_survives_failed_delivery(mock_httpx_client):
+    """Test that a delivery that raises doesn't stop later items or hang close()."""
+    mock_httpx_client.return_value = AsyncMock()
+    delivered = []
+
+    async def fake_send(client, payload):
+        if payload["session_id"] == "sess-bad":
+            raise RuntimeError("boom")
+        delivered.append(payload["session_id"])
+
+    with patch("pincer_sdk.client.send_conversion", side_effect=fake_send):
+        client = PincerClient(
+            base_url="http://test.pincer",
+            webhook_secret="test_secret",
+            conversion_workers=1,
+        )
+        await client.__aenter__()
+        for session_id in ("sess-bad", "sess-1", "sess-2"):
+            await client.report_conversion(
+                session_id=session_id, user_address="0xUser", purchase_amount=1.0
+            )
+        await asyncio.wait_for(client.close(), timeout=5)
+
+    assert delivered == ["sess-1", "sess-2"]
+
+@pytest.mark.asyncio
+async def test_report_conversions_bulk_preserves_order(mock_httpx_client):
+    """Test that bulk reporting sends every event and keeps input order."""
+    from pincer_sdk.types import ConversionEvent
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"status": "success"})
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.post.return_value = mock_response
+    mock_httpx_client.return_value = mock_client_instance
+
+    client = PincerClient(
+        base_url="http://test.pincer",
+        webhook_secret="test_secret",
+        max_concurrent_reports=2,
+    )
+    events = [
+        ConversionEvent(session_id=f"sess-{i}", user_address="0xUser", purchase_amount=10.0 + i)
+        for i in range(5)
+    ]
+
+    responses = await client.report_conversions_bulk(events)
+
+    assert [r.status for r in responses] == ["success"] * 5
+    assert mock_client_instance.post.call_count == 5
+    sent = [json.loads(call.kwargs["content"]) for call in mock_client_instance.post.call_args_list]
+    session_by_webhook = {body["webhook_id"]: body["session_id"] for body in sent}
+    assert [session_by_webhook[r.webhook_id] for r in responses] == [e.session_id for e in events]
+
+
+@pytest.mark.asyncio
+async def test_warmup_primes_connection(mock_httpx_client):
+    """Test that warmup issues a health check on enter and tolerates failures."""
+    import httpx
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.get.side_effect = httpx.ConnectError("unreachable")
+    mock_httpx_client.return_value = mock_client_instance
+
+    async with PincerClient(base_url="http://test.pincer", warmup=True):
+        pass
+
+    mock_client_instance.get.assert_awaited_once_with("/health", timeout=2.0)
+
+
+def test_sign_matches_webhook_signature():
+    """Test that the pre-keyed signer matches a one-shot HMAC of the body."""
+    from pincer_sdk.utils import create_webhook_signature
+
+    client = PincerClient(base_url="http://test.pincer", webhook_secret="test_secret")
+    body = '{"webhook_id": "wh-123"}'
+
+    assert client._sign(body.encode()) == create_webhook_signature(body, "test_secret")
+    assert client._sign(body.encode()) == client._sign(body.encode())
@@ -1,6 +1,6 @@
 """Unit tests for sponsor budget management."""
 
-from datetime import datetime
+import time
 
 import pytest
 
@@ -18,7 +18,7 @@ class TestBudgetManagement:
         db = Database(str(db_path))
         await db.initialize()
         
-        # Manually insert a test campaign
+        # Manually insert a test campaign (money in atomic units)
         import aiosqlite
         async with aiosqlite.connect(db.db_path) as conn:
             await conn.execute(
@@ -34,20 +34,21 @@ class TestBudgetManagement:
                     "shake-shack-promo",
                     "Shake Shack",
                     "Get 15% off",
-                    5.00,
+                    5_000_000,
                     "USDC",
                     "solana:devnet",
-                    100.00,
-                    100.00,
+                    100_000_000,
+                    100_000_000,
                     "USDC",
                     1,
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
+                    time.time_ns() // 1000,
+                    time.time_ns() // 1000,
                 ),
             )
             await conn.commit()
             
-        return db
+        yield db
+        await db.close()
 
     @pytest.mark.asyncio
     async def test_budget_reservation_success(self, test_db):
@@ -111,3 +112,23 @@ class TestBudgetManagement:
         
         success = await test_db.reserve_budget("shake-shack-promo", 5.00)
         assert success is False
+
+    @pytest.mark.asyncio
+    async def test_reload_campaigns_picks_up_external_edits(self, test_db):
+        """Test that campaign reads are cached until reload_campaigns()."""
+        campaign = await test_db.get_campaign("shake-shack-promo")
+        assert campaign.active is True
+
+        # Edit the row behind the cache's back
+        import aiosqlite
+        async with aiosqlite.connect(test_db.db_path) as conn:
+            await conn.execute("UPDATE campaigns SET active = 0 WHERE campaign_id = ?", ("shake-shack-promo",))
+            await conn.commit()
+
+        campaign = await test_db.get_campaign("shake-shack-promo")
+        assert campaign.active is True
+
+        await test_db.reload_campaigns()
+        campaign = await test_db.get_campaign("shake-shack-promo")
+        assert campaign.active is False
+        assert await test_db.get_active_campaigns() == []
@@ -0,0 +1,106 @@
+"""Unit tests for ledger schema migrations."""
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from src.database import Database
+
+# Version 0 layout: timestamps stored as ISO-8601 text
+V0_SCHEMA = """
+CREATE TABLE campaigns (
+    campaign_id TEXT PRIMARY KEY, merchant_name TEXT NOT NULL, offer_text TEXT NOT NULL,
+    rebate_amount REAL NOT NULL, rebate_asset TEXT NOT NULL, rebate_network TEXT NOT NULL,
+    budget_total REAL NOT NULL, budget_remaining REAL NOT NULL, budget_asset TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1, created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+);
+CREATE TABLE sessions (
+    session_id TEXT PRIMARY KEY, user_address TEXT NOT NULL, network TEXT NOT NULL,
+    amount_paid REAL NOT NULL, payment_asset TEXT NOT NULL, payment_hash TEXT,
+    verified_at TEXT NOT NULL, rebate_settled INTEGER NOT NULL DEFAULT 0, correlation_id TEXT
+);
+CREATE TABLE webhooks (
+    webhook_id TEXT PRIMARY KEY, session_id TEXT NOT NULL, user_address TEXT NOT NULL,
+    status TEXT NOT NULL, received_at TEXT NOT NULL, processed_at TEXT,
+    error_message TEXT, rebate_tx_hash TEXT
+);
+CREATE TABLE settlements (
+    settlement_id TEXT PRIMARY KEY, session_id TEXT NOT NULL, webhook_id TEXT NOT NULL,
+    user_address TEXT NOT NULL, rebate_amount REAL NOT NULL, rebate_asset TEXT NOT NULL,
+    network TEXT NOT NULL, tx_hash TEXT, status TEXT NOT NULL, campaign_id TEXT NOT NULL,
+    settled_at TEXT NOT NULL, confirmed_at TEXT, correlation_id TEXT
+);
+"""
+
+
+@pytest.mark.unit
+class TestSchemaMigration:
+    """Test upgrading databases written by older versions."""
+
+    @pytest.mark.asyncio
+    async def test_migrates_iso_timestamps(self, tmp_path):
+        """Test that version 0 ISO-8601 timestamps survive the upgrade exactly."""
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(V0_SCHEMA)
+        conn.execute(
+            "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("sess-old", "0xabc", "eip155:84532", 0.1, "USDC", None,
+             "2026-01-02T03:04:05.123456", 1, None),
+        )
+        conn.execute(
+            "INSERT INTO webhooks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            ("wh-old", "sess-old", "0xabc", "completed", "2026-01-02T03:04:05", None, None, "0xtx"),
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        await db.initialize()
+        try:
+            session = await db.get_session("sess-old")
+            webhook = await db.get_webhook("wh-old")
+        finally:
+            await db.close()
+
+        assert session.verified_at == datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+        assert session.amount_paid == 0.1
+        assert session.rebate_settled is True
+        assert webhook.received_at == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert webhook.processed_at is None
+
+    @pytest.mark.asyncio
+    async def test_migrates_real_money_to_atomic_units(self, tmp_path):
+        """Test that version 1 REAL amounts become exact integer atomic units."""
+        db_path = str(tmp_path / "v1.db")
+        conn = sqlite3.connect(db_path)
+        # Version 1 layout: the version 0 tables with INTEGER timestamps
+        conn.executescript(V0_SCHEMA.replace("_at TEXT", "_at INTEGER"))
+        conn.execute(
+            "INSERT INTO campaigns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("promo", "Shake Shack", "15% off", 0.1, "USDC", "eip155:84532",
+             1.0, 0.7, "USDC", 1, 1_767_323_045_000_000, 1_767_323_045_000_000),
+        )
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        await db.initialize()
+        try:
+            campaign = await db.get_campaign("promo")
+        finally:
+            await db.close()
+
+        conn = sqlite3.connect(db_path)
+        stored = conn.execute(
+            "SELECT rebate_amount, budget_remaining FROM campaigns"
+        ).fetchone()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+
+        assert stored == (100_000, 700_000)
+        assert version == 2
+        assert campaign.budget_remaining == 0.7
+        assert campaign.created_at == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)